@@ -0,0 +1,50 @@
+import asyncio
+
+import aiohttp
+
+from Additions.browser import get_parser, is_authorized, parse_page, parse_student_marks, parse_student_name
+from options import Options
+
+def create_connector(limit=100, limit_per_host=None):
+	return aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host or Options.WORKERS)
+
+class AsyncBrowser(object):
+	def __init__(self, connector=None, parser=None, executor=None):
+		self.parser = parser or get_parser()
+		self.executor = executor
+		self.session = aiohttp.ClientSession(connector=connector, connector_owner=connector is None, cookie_jar=aiohttp.CookieJar(unsafe=True))
+		self.page_content = None
+		self.subjects_number = 0
+
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, *args):
+		await self.close()
+
+	async def close(self):
+		await self.session.close()
+
+	async def _run(self, function, *args):
+		return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+	async def login(self, student):
+		payload = {'login':student.login, 'password':student.password}
+		async with self.session.post(Options.URL, data=payload) as response:
+			html = await response.text()
+		return await self._run(is_authorized, html, self.parser)
+
+	async def fetch_page_content(self):
+		async with self.session.get(f'{Options.URL}?module=grades') as response:
+			return await response.text()
+
+	async def setup_page_content(self):
+		self.page_content = await self._run(parse_page, await self.fetch_page_content(), self.parser)
+
+	async def get_student_name(self):
+		return await self._run(parse_student_name, self.page_content)
+
+	async def get_student_marks(self):
+		marks = await self._run(parse_student_marks, self.page_content)
+		self.subjects_number = len(marks)
+		return marks
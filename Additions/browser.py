@@ -1,48 +1,211 @@
-import bs4
-import requests
+import threading
+import time
 
 from Additions.mark import Mark
+from options import Options
+
+_parser = None
+_strainers = None
+_adapter = None
+_adapter_lock = threading.Lock()
+
+def get_parser():
+	global _parser
+	if _parser is None:
+		import bs4
+		_parser = 'lxml' if bs4.builder_registry.lookup('lxml') else 'html.parser'
+	return _parser
+
+def get_strainers():
+	global _strainers
+	if _strainers is None:
+		import bs4
+		_strainers = {
+			'error':bs4.SoupStrainer("div", {"class":"error"}),
+			'auth':bs4.SoupStrainer(["div", "input"]),
+			'page':bs4.SoupStrainer(["div", "tr"], {"class":["top-panel-name", "cl-row"]}),
+		}
+	return _strainers
+
+def get_adapter():
+	global _adapter
+	with _adapter_lock:
+		if _adapter is None:
+			from requests.adapters import HTTPAdapter
+			from urllib3.util.retry import Retry
+
+			retry = Retry(total=Options.RETRIES, backoff_factor=Options.BACKOFF, status_forcelist=(500, 502, 503, 504))
+			_adapter = HTTPAdapter(pool_connections=Options.POOL_CONNECTIONS, pool_maxsize=Options.POOL_SIZE, max_retries=retry)
+		return _adapter
+
+def connection_stats():
+	connections = 0
+	requests_number = 0
+	if _adapter is not None:
+		pools = _adapter.poolmanager.pools
+		for key in pools.keys():
+			pool = pools[key]
+			connections += pool.num_connections
+			requests_number += pool.num_requests
+	return {'connections':connections, 'requests':requests_number, 'reused':requests_number - connections}
 
 class Browser(object):
-	def __init__(self):
+	def __init__(self, parser=None, cache=None, sessions=None, limiter=None):
+		import requests
+
+		self.parser = parser or get_parser()
+		self.cache = cache
+		self.sessions = sessions
+		self.limiter = limiter
 		self.session = requests.session()
+		self.session.mount('http://', get_adapter())
+		self.session.mount('https://', get_adapter())
+		self.login_name = None
+		self.restored = False
+		self.response = None
+		self.entry = None
 		self.page_content = None
 		self.subjects_number = 0
 
 	def login(self, student):
+		self.login_name = student.login
+		if self.restore_session():
+			return True
+
 		payload = {'login':student.login, 'password':student.password}
-		response = self.session.post('http://best.yos.kz/cabinet/', data=payload)
-		return bs4.BeautifulSoup(response.text, 'html.parser').find("div", {"class":"error"}) is None
+		response = self.request('POST', Options.URL, data=payload)
+		authorized = is_authorized(response.text, self.parser)
+
+		if authorized and self.sessions is not None:
+			import requests
+			self.sessions.save(self.login_name, requests.utils.dict_from_cookiejar(self.session.cookies))
+		return authorized
+
+	def logout(self):
+		if self.sessions is not None and self.login_name is not None:
+			self.sessions.drop(self.login_name)
+		self.session.cookies.clear()
+		self.restored = False
+		self.response = self.entry = None
+
+	def request(self, method, url, **kwargs):
+		if self.limiter is None:
+			return self.session.request(method, url, timeout=Options.TIMEOUT, **kwargs)
+
+		self.limiter.acquire()
+		start = time.monotonic()
+		error = True
+		try:
+			response = self.session.request(method, url, timeout=Options.TIMEOUT, **kwargs)
+			error = response.status_code == 429 or response.status_code >= 500
+			return response
+		finally:
+			self.limiter.release(time.monotonic() - start, error)
+
+	def restore_session(self):
+		import bs4
+
+		if self.sessions is None:
+			return False
+
+		cookies = self.sessions.load(self.login_name)
+		if not cookies:
+			return False
+
+		self.session.cookies.update(cookies)
+		entry = None
+		if self.cache is not None:
+			entry, fresh = self.cache.lookup(self.login_name)
+			if fresh:
+				self.restored = True
+				self.entry = entry
+				return True
+
+		response = self.request_page(entry)
+		if response.status_code == 304:
+			authorized = True
+		else:
+			page_content = bs4.BeautifulSoup(response.text, self.parser, parse_only=get_strainers()['auth'])
+			authorized = page_content.find("div", {"class":"error"}) is None and page_content.find("input", {"name":"password"}) is None
+		if authorized:
+			self.restored = True
+			self.response = response
+			self.entry = entry
+			return True
+
+		self.sessions.drop(self.login_name)
+		self.session.cookies.clear()
+		return False
+
+	def request_page(self, entry=None):
+		headers = {}
+		if entry is not None and entry['etag']:
+			headers['If-None-Match'] = entry['etag']
+		if entry is not None and entry['last_modified']:
+			headers['If-Modified-Since'] = entry['last_modified']
+		return self.request('GET', f'{Options.URL}?module=grades', headers=headers)
+
+	def fetch_page_content(self):
+		response, entry = self.response, self.entry
+		self.response = self.entry = None
+
+		if response is None and entry is None:
+			if self.cache is None:
+				return self.request_page().text
+
+			entry, fresh = self.cache.lookup(self.login_name)
+			if not fresh:
+				response = self.request_page(entry)
+
+		if response is None:
+			return entry['html']
+		if self.cache is None:
+			return response.text
+		if entry is not None and response.status_code == 304:
+			return self.cache.revalidate(self.login_name, entry)
+		return self.cache.store(self.login_name, response)
 
 	def setup_page_content(self):
-		response = self.session.get('http://best.yos.kz/cabinet/?module=grades')
-		self.page_content = bs4.BeautifulSoup(response.text, "html.parser")
+		self.page_content = parse_page(self.fetch_page_content(), self.parser)
 
 	def get_student_name(self):
-		return self.page_content.find_all("div", {"class":"top-panel-name"})[0].getText()
+		return parse_student_name(self.page_content)
 
-	def setup_student_subjects_number(self):
-		subjects_number = 0
-		while True:
-			try:
-				float(self.page_content.find_all("tr", {"class":"cl-row"})[subjects_number].find_all('td')[0].getText())
-				subjects_number += 1
-			except ValueError:
-				break
+	def get_student_marks(self):
+		marks = parse_student_marks(self.page_content)
+		self.subjects_number = len(marks)
+		return marks
 
-		self.subjects_number = subjects_number
+def is_authorized(html, parser=None):
+	import bs4
+	return bs4.BeautifulSoup(html, parser or get_parser(), parse_only=get_strainers()['error']).find("div", {"class":"error"}) is None
 
-	def get_student_marks(self):
-		self.setup_student_subjects_number()
-
-		marks = []
-		i = 0
-		for tr in self.page_content.find_all("tr", {"class":"cl-row"})[self.subjects_number:self.subjects_number * 2]:
-			mark = Mark(self.page_content.find_all("tr", {"class":"cl-row"})[i].find_all('td')[1].getText())
-			i += 1
-			for td in tr.find_all('td'):
-				if td.find('span') is not None and len(td.find('span')) != 0:
-					mark.add_mark(td.find('span').getText())
-			marks.append(mark)
+def parse_page(html, parser=None):
+	import bs4
+	return bs4.BeautifulSoup(html, parser or get_parser(), parse_only=get_strainers()['page'])
 
-		return marks
+def parse_student_name(page_content):
+	return page_content.find_all("div", {"class":"top-panel-name"})[0].getText()
+
+def parse_student_marks(page_content):
+	rows = page_content.find_all("tr", {"class":"cl-row"})
+
+	subjects = []
+	for tr in rows:
+		tds = tr.find_all('td')
+		try:
+			float(tds[0].getText())
+		except ValueError:
+			break
+		subjects.append(tds[1].getText())
+
+	marks = []
+	for subject, tr in zip(subjects, rows[len(subjects):len(subjects) * 2]):
+		mark = Mark(subject)
+		for td in tr.find_all('td'):
+			span = td.find('span')
+			if span is not None and len(span) != 0:
+				mark.add_mark(span.getText())
+		marks.append(mark)
+
+	return marks
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+from options import Options
+
+class PageCache(object):
+	def __init__(self, directory=None, ttl=None, max_size=None, max_age=None):
+		self.directory = directory or Options.CACHE_DIR
+		self.ttl = Options.CACHE_TTL if ttl is None else ttl
+		self.max_size = Options.CACHE_MAX_SIZE if max_size is None else max_size
+		self.max_age = Options.CACHE_MAX_AGE if max_age is None else max_age
+
+		self.hits = 0
+		self.misses = 0
+		self.revalidations = 0
+
+		self._lock = threading.Lock()
+		self._sizes = {}
+		self._size = 0
+
+		os.makedirs(self.directory, exist_ok=True)
+		for name in os.listdir(self.directory):
+			path = os.path.join(self.directory, name)
+			if time.time() - os.path.getmtime(path) > self.max_age:
+				os.remove(path)
+			else:
+				self._sizes[path] = os.path.getsize(path)
+				self._size += self._sizes[path]
+		self.evict()
+
+	def _path(self, login):
+		return os.path.join(self.directory, f'{hashlib.sha256(login.encode()).hexdigest()}.json')
+
+	def _read(self, login):
+		try:
+			with open(self._path(login), encoding='utf-8') as file:
+				entry = json.load(file)
+		except (OSError, ValueError):
+			return None
+
+		if time.time() - entry['stored'] > self.max_age:
+			return None
+		return entry
+
+	def _write(self, login, entry):
+		path = self._path(login)
+		with open(path, 'w', encoding='utf-8') as file:
+			json.dump(entry, file, ensure_ascii=False)
+
+		with self._lock:
+			self._size -= self._sizes.get(path, 0)
+			self._sizes[path] = os.path.getsize(path)
+			self._size += self._sizes[path]
+		self.evict()
+
+	def lookup(self, login):
+		entry = self._read(login)
+		if entry is not None and time.time() - entry['stored'] < self.ttl:
+			with self._lock:
+				self.hits += 1
+			return entry, True
+		return entry, False
+
+	def revalidate(self, login, entry):
+		with self._lock:
+			self.revalidations += 1
+
+		entry['stored'] = time.time()
+		self._write(login, entry)
+		return entry['html']
+
+	def store(self, login, response):
+		with self._lock:
+			self.misses += 1
+
+		entry = {
+			'html':response.text,
+			'etag':response.headers.get('ETag'),
+			'last_modified':response.headers.get('Last-Modified'),
+			'hash':hashlib.sha256(response.content).hexdigest(),
+			'stored':time.time(),
+		}
+		self._write(login, entry)
+		return entry['html']
+
+	def evict(self):
+		with self._lock:
+			if self._size <= self.max_size:
+				return
+
+			for path in sorted(self._sizes, key=os.path.getmtime):
+				os.remove(path)
+				self._size -= self._sizes.pop(path)
+				if self._size <= self.max_size:
+					break
+
+	def report(self):
+		return f'Кэш: попаданий {self.hits}, промахов {self.misses}, перепроверок {self.revalidations}'
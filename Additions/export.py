@@ -0,0 +1,60 @@
+import csv
+import json
+
+FIELDS = ['login', 'name', 'subject', 'marks', 'marks_number', 'mean', 'access']
+
+def iter_records(students):
+	for student in students:
+		if student.marks is None:
+			continue
+		for mark in student.marks:
+			yield {
+				'login':student.login,
+				'name':student.name,
+				'subject':mark.subject,
+				'marks':mark.values.tolist(),
+				'marks_number':mark.marks_number,
+				'mean':mark.mean,
+				'access':mark.access,
+			}
+
+def write_csv(students, fp):
+	writer = csv.DictWriter(fp, FIELDS)
+	writer.writeheader()
+	for record in iter_records(students):
+		record['marks'] = ' '.join(map(str, record['marks']))
+		writer.writerow(record)
+
+def write_jsonl(students, fp):
+	for record in iter_records(students):
+		fp.write(json.dumps(record, ensure_ascii=False))
+		fp.write('\n')
+
+def write_parquet(students, path, batch_size=10000):
+	try:
+		import pyarrow
+		import pyarrow.parquet
+	except ImportError:
+		raise Exception('Parquet export requires pyarrow: "pip install pyarrow"!')
+
+	schema = pyarrow.schema([
+		('login', pyarrow.string()),
+		('name', pyarrow.string()),
+		('subject', pyarrow.string()),
+		('marks', pyarrow.list_(pyarrow.int8())),
+		('marks_number', pyarrow.int32()),
+		('mean', pyarrow.float64()),
+		('access', pyarrow.int32()),
+	])
+
+	with pyarrow.parquet.ParquetWriter(path, schema) as writer:
+		batch = []
+		for record in iter_records(students):
+			batch.append(record)
+			if len(batch) == batch_size:
+				writer.write_table(pyarrow.Table.from_pylist(batch, schema))
+				batch = []
+		if batch:
+			writer.write_table(pyarrow.Table.from_pylist(batch, schema))
+
+WRITERS = {'csv':write_csv, 'jsonl':write_jsonl, 'parquet':write_parquet}
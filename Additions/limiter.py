@@ -0,0 +1,81 @@
+import threading
+import time
+
+from options import Options
+
+class RateLimiter(object):
+	def __init__(self, rate=None, burst=None, max_concurrency=None, min_concurrency=1, target_latency=None):
+		self.rate = rate or Options.RATE
+		self.burst = burst or Options.BURST
+		self.max_concurrency = max_concurrency or Options.WORKERS
+		self.min_concurrency = min_concurrency
+		self.target_latency = target_latency or Options.TARGET_LATENCY
+
+		self.limit = float(self.max_concurrency)
+		self.tokens = float(self.burst)
+		self.in_flight = 0
+		self.issued = 0
+		self.completed = 0
+
+		self.throttled = 0
+		self.waited = 0.0
+		self.decreases = 0
+
+		self._recovery = 0
+		self._updated = time.monotonic()
+		self._condition = threading.Condition()
+
+	def _refill(self):
+		now = time.monotonic()
+		self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+		self._updated = now
+
+	def acquire(self):
+		start = time.monotonic()
+		throttled = False
+
+		with self._condition:
+			while True:
+				self._refill()
+				if self.in_flight < int(self.limit) and self.tokens >= 1:
+					break
+
+				throttled = True
+				if self.tokens < 1:
+					self._condition.wait((1 - self.tokens) / self.rate)
+				else:
+					self._condition.wait()
+
+			self.tokens -= 1
+			self.in_flight += 1
+			self.issued += 1
+			if throttled:
+				self.throttled += 1
+				self.waited += time.monotonic() - start
+
+	def release(self, latency, error=False):
+		with self._condition:
+			self.in_flight -= 1
+			self.completed += 1
+
+			# The requests that were already sent when the limit was cut
+			# report the same congestion, so they do not cut it again
+			if self.completed <= self._recovery:
+				pass
+			elif error or latency > self.target_latency:
+				self.limit = max(self.min_concurrency, self.limit / 2)
+				self.decreases += 1
+				self._recovery = self.issued
+			else:
+				self.limit = min(self.max_concurrency, self.limit + 1 / self.limit)
+			self._condition.notify_all()
+
+	def metrics(self):
+		with self._condition:
+			return {
+				'limit':int(self.limit),
+				'in_flight':self.in_flight,
+				'throttled':self.throttled,
+				'waited':self.waited,
+				'decreases':self.decreases,
+			}
@@ -1,47 +1,78 @@
-import statistics
-
+from Additions import export
 from Additions.browser import Browser
+from Additions.report import StudentReport, render
 from Additions.student import Student
-from Utils import bcolors
-from Utils.bcolors import BColors
-from Utils.table import Table
+from Utils import renderer
 
 class Manager(object):
-	def __init__(self, student: Student):
+	def __init__(self, student: Student, strict=True, cache=None, sessions=None, limiter=None):
 		self.student = student
-		self.browser = Browser()
-		self.view = None
+		self.browser = Browser(cache=cache, sessions=sessions, limiter=limiter)
+		self._view = None
+		self._report = None
+		self.error = None
+
+		import requests
+
+		try:
+			self.authorized = self.browser.login(self.student)
+			if self.authorized:
+				self.browser.setup_page_content()
+				self.setup_student_name()
+				self.setup_student_marks()
+		except requests.RequestException as error:
+			self.authorized = False
+			self.error = error
 
-		if not self.browser.login(self.student):
+		if strict and self.error is not None:
+			self.error_network(self.error)
+			exit()
+		if strict and not self.authorized:
 			self.error_auth()
 			exit()
 
-		self.browser.setup_page_content()
-		self.setup_student_name()
-		self.setup_student_marks()
-		self.setup_view()
-
 	def setup_student_name(self):
 		self.student.name = self.browser.get_student_name()
 
 	def setup_student_marks(self):
 		self.student.marks = self.browser.get_student_marks()
 
-	def setup_view(self):
-		table = Table(['Предмет', 'Оценки', 'Кол-во оценок', 'Средний балл', 'До допуска'])
+	@property
+	def view(self):
+		if self._view is None:
+			self.setup_view()
+		return self._view
 
-		means = []
-		counter = 0
+	def check_authorized(self):
+		if not self.authorized:
+			raise Exception(f'Оценки ученика "{self.student.login}" не загружены: вход не выполнен!')
 
-		for mark in self.student.marks:
-			mark.gen_view()
-			if mark.mean != 0:
-				means.append(mark.mean)
-				counter += 1
-			table.add_row([mark.view_subject, mark.view_marks, mark.view_marks_number, mark.view_mean, mark.view_access])
+	def analyze(self):
+		self.check_authorized()
+		if self._report is None:
+			self._report = StudentReport(self.student)
+		return self._report
 
-		self.view = f'{BColors.BOLD}Ученик: {BColors.GREEN}{self.student.name}{BColors.ENDC}\n{BColors.BOLD}Средний балл среди предметов: {BColors.GREEN}{bcolors.mark_to_colored(round(statistics.mean(means), 2))}\n{table}'
+	def update_report(self, report):
+		self._report = report
+		self._view = None
+
+	def access_matrix(self, pairs):
+		self.check_authorized()
+		return {mark.subject:mark.access_grid(pairs) for mark in self.student.marks}
+
+	def setup_view(self):
+		self._view = render(self.analyze())
+
+	def export(self, output, format='csv'):
+		export.WRITERS[format]([self.student], output)
 
 	@staticmethod
 	def error_auth():
-		print(f'{BColors.RED}{BColors.BOLD}Ошибка авторизации: "Неверный логин или пароль"!{BColors.ENDC}')
+		colors = renderer.active.colors
+		print(f'{colors.RED}{colors.BOLD}Ошибка авторизации: "Неверный логин или пароль"!{colors.ENDC}')
+
+	@staticmethod
+	def error_network(error):
+		colors = renderer.active.colors
+		print(f'{colors.RED}{colors.BOLD}Ошибка соединения: "{error}"!{colors.ENDC}')
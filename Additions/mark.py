@@ -1,65 +1,85 @@
-import statistics
+import math
+from array import array
 
-from Utils.bcolors import BColors
-from Utils.umath import access
+from Utils import renderer
+from Utils.umath import access, assumed_mark
 from options import Options
 
 class Mark(object):
+	__slots__ = ('subject', 'values', 'total', 'count', 'min', 'max', '_mean', '_m2')
+
 	def __init__(self, subject):
 		self.subject = subject
-		self.values = []
-
-		self.marks_number = 0
-		self.mean = 0
-		self.access = 0
+		self.values = array('b')
 
-		self.view_subject = ''
-		self.view_marks = ''
-		self.view_mean = format(0, '.2f')
-		self.view_marks_number = '0'
-		self.view_access = ''
+		self.total = 0
+		self.count = 0
+		self.min = None
+		self.max = None
+		self._mean = 0.0
+		self._m2 = 0.0
 
 	def add_mark(self, mark):
-		self.values.append(int(mark))
-		self.calculate()
-
-	def calculate(self):
-		self.marks_number = len(self.values)
-		self.mean = round(statistics.mean(self.values), 2)
-
-	def gen_view(self):
-		if self.mean == 0:
-			self.view_subject = f'{BColors.GREEN}{self.subject}{BColors.ENDC}'
-			self.view_mean = f'{BColors.YELLOW}-{BColors.ENDC}'
-		elif self.mean < Options.EXCELLENT_MARK:
-			self.view_subject = f'{BColors.RED}{self.subject}{BColors.ENDC}'
-			self.view_mean = f'{BColors.RED}{format(self.mean, ".2f")}{BColors.ENDC}'
-		else:
-			self.view_subject = f'{BColors.GREEN}{self.subject}{BColors.ENDC}'
-			self.view_mean = f'{BColors.GREEN}{format(self.mean, ".2f")}{BColors.ENDC}'
-
-		if len(self.values) == 0:
-			self.view_marks = f'{BColors.YELLOW}-{BColors.ENDC}'
-		else:
-			for value in self.values:
-				if value == Options.MAX_MARK:
-					self.view_marks += f'{BColors.MAGENTA}{str(value)}{BColors.ENDC} '
-				elif value < Options.EXCELLENT_MARK:
-					self.view_marks += f'{BColors.RED}{str(value)}{BColors.ENDC} '
-				else:
-					self.view_marks += f'{BColors.GREEN}{str(value)}{BColors.ENDC} '
-
-		if self.mean < Options.EXCELLENT_MARK and len(self.values) > 0:
-			self.access = access(self.values)
-
-		if len(self.values) == 0:
-			self.view_access = f'{BColors.YELLOW}-{BColors.ENDC}'
-		elif self.access > 0:
-			self.view_access = f'{BColors.RED}{self.access}{BColors.ENDC}'
-		else:
-			self.view_access = f'{BColors.GREEN}{self.access}{BColors.ENDC}'
-
-		if self.marks_number == 0:
-			self.view_marks_number = f'{BColors.YELLOW}{self.marks_number}{BColors.ENDC}'
-		else:
-			self.view_marks_number = f'{BColors.GREEN}{self.marks_number}{BColors.ENDC}'
+		value = int(mark)
+		self.values.append(value)
+
+		self.total += value
+		self.count += 1
+		if self.min is None or value < self.min:
+			self.min = value
+		if self.max is None or value > self.max:
+			self.max = value
+
+		delta = value - self._mean
+		self._mean += delta / self.count
+		self._m2 += delta * (value - self._mean)
+
+	@property
+	def marks_number(self):
+		return self.count
+
+	@property
+	def mean(self):
+		if self.count == 0:
+			return 0
+		return round(self.total / self.count, 2)
+
+	@property
+	def variance(self):
+		if self.count < 2:
+			return 0.0
+		return self._m2 / (self.count - 1)
+
+	@property
+	def stdev(self):
+		return math.sqrt(self.variance)
+
+	@property
+	def access(self):
+		if self.count == 0 or self.mean >= Options.EXCELLENT_MARK:
+			return 0
+		return access(self.total, self.count, Options.EXCELLENT_MARK, assumed_mark(Options.EXCELLENT_MARK))
+
+	def access_grid(self, pairs):
+		mean = self.mean
+		return [0 if self.count == 0 or mean >= target else access(self.total, self.count, target, filler) for target, filler in pairs]
+
+	@property
+	def view_subject(self):
+		return renderer.active.subject(self.subject, self.mean)
+
+	@property
+	def view_mean(self):
+		return renderer.active.mean(self.mean)
+
+	@property
+	def view_marks(self):
+		return renderer.active.marks(self.values)
+
+	@property
+	def view_access(self):
+		return renderer.active.access(self.count, self.access)
+
+	@property
+	def view_marks_number(self):
+		return renderer.active.marks_number(self.count)
@@ -0,0 +1,82 @@
+import statistics
+from array import array
+
+import numpy
+
+from Utils.umath import assumed_mark
+from options import Options
+
+class GradeMatrix(object):
+	def __init__(self, students):
+		values = array('b')
+		offsets = [0]
+		owners = []
+		codes = []
+
+		self.logins = []
+		self.subjects = {}
+		for index, student in enumerate(students):
+			self.logins.append(student.login)
+			for mark in student.marks or []:
+				values.extend(mark.values)
+				offsets.append(len(values))
+				owners.append(index)
+				codes.append(self.subjects.setdefault(mark.subject, len(self.subjects)))
+
+		self.values = numpy.frombuffer(values, dtype=numpy.int8) if values else numpy.zeros(0, dtype=numpy.int8)
+		self.offsets = numpy.array(offsets, dtype=numpy.int64)
+		self.owners = numpy.array(owners, dtype=numpy.int64)
+		self.codes = numpy.array(codes, dtype=numpy.int64)
+
+		totals = numpy.concatenate(([0], numpy.cumsum(self.values, dtype=numpy.int64)))
+		self.totals = totals[self.offsets[1:]] - totals[self.offsets[:-1]]
+		self.counts = numpy.diff(self.offsets)
+
+	def means(self):
+		means = numpy.zeros(len(self.counts))
+		graded = self.counts > 0
+		means[graded] = self.totals[graded] / self.counts[graded]
+		return _round(means, lambda index: means[index])
+
+	def access(self, target=None, filler=None):
+		target = Options.EXCELLENT_MARK if target is None else target
+		filler = assumed_mark(target) if filler is None else filler
+
+		# Cells that can not be reached are masked, so tolist() gives None like Mark.access_grid()
+		below = (self.counts > 0) & (self.means() < target)
+		if filler <= target:
+			return numpy.ma.masked_array(numpy.zeros(len(self.counts), dtype=numpy.int64), mask=below)
+
+		needed = -((self.totals - target * self.counts) // (filler - target))
+		return numpy.ma.masked_array(numpy.where(below, needed, 0), mask=numpy.zeros(len(self.counts), dtype=bool))
+
+	def student_means(self):
+		return self._group_means(self.owners, len(self.logins))
+
+	def subject_means(self):
+		return dict(zip(self.subjects, self._group_means(self.codes, len(self.subjects)).tolist()))
+
+	def _group_means(self, groups, size):
+		means = self.means()
+		graded = means != 0
+		means, groups = means[graded], groups[graded]
+
+		totals = numpy.bincount(groups, weights=means, minlength=size)
+		numbers = numpy.bincount(groups, minlength=size)
+
+		result = numpy.zeros(size)
+		result[numbers > 0] = totals[numbers > 0] / numbers[numbers > 0]
+
+		order = numpy.argsort(groups, kind='stable')
+		means = means[order]
+		starts = numpy.searchsorted(groups[order], numpy.arange(size + 1))
+		return _round(result, lambda index: statistics.mean(means[starts[index]:starts[index + 1]].tolist()))
+
+def _round(values, exact):
+	rounded = numpy.round(values, 2)
+
+	# Python rounds the exact binary value, so recheck the cases that sit on a half
+	scaled = values * 100
+	for index in numpy.flatnonzero(numpy.abs(scaled - numpy.floor(scaled) - 0.5) < 1e-6):
+		rounded[index] = round(float(exact(index)), 2)
+	return rounded
@@ -0,0 +1,39 @@
+from Utils import bcolors, renderer
+
+class SubjectReport(object):
+	__slots__ = ('subject', 'values', 'marks_number', 'mean', 'access')
+
+	def __init__(self, mark):
+		self.subject = mark.subject
+		self.values = tuple(mark.values)
+		self.marks_number = mark.marks_number
+		self.mean = mark.mean
+		self.access = mark.access
+
+class StudentReport(object):
+	__slots__ = ('login', 'name', 'subjects', 'mean')
+
+	def __init__(self, student):
+		import statistics
+
+		self.login = student.login
+		self.name = student.name
+		self.subjects = [SubjectReport(mark) for mark in student.marks]
+
+		means = [subject.mean for subject in self.subjects if subject.mean != 0]
+		self.mean = round(statistics.mean(means), 2) if means else 0
+
+def render_row(subject):
+	active = renderer.active
+	return [active.subject(subject.subject, subject.mean), active.marks(subject.values), active.marks_number(subject.marks_number), active.mean(subject.mean), active.access(subject.marks_number, subject.access)]
+
+def render(report, rows=None):
+	from Utils.table import Table
+
+	table = Table(['Предмет', 'Оценки', 'Кол-во оценок', 'Средний балл', 'До допуска'])
+
+	for row in rows if rows is not None else map(render_row, report.subjects):
+		table.add_row(row)
+
+	colors = renderer.active.colors
+	return f'{colors.BOLD}Ученик: {colors.GREEN}{report.name}{colors.ENDC}\n{colors.BOLD}Средний балл среди предметов: {colors.GREEN}{bcolors.mark_to_colored(report.mean, colors)}\n{table}'
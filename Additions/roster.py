@@ -0,0 +1,75 @@
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import requests
+
+from Additions.browser import Browser, parse_page, parse_student_marks, parse_student_name
+from Additions.manager import Manager
+from Additions.student import Student
+from options import Options
+
+def fetch_roster(credentials, workers=None, cache=None, sessions=None, limiter=None):
+	students = [Student(login=login, password=password) for login, password in credentials]
+
+	with ThreadPoolExecutor(max_workers=workers or Options.WORKERS) as executor:
+		return list(executor.map(lambda student: Manager(student, strict=False, cache=cache, sessions=sessions, limiter=limiter), students))
+
+def parse_grades(html, parser=None):
+	start = time.perf_counter()
+	page_content = parse_page(html, parser)
+	return parse_student_name(page_content), parse_student_marks(page_content), time.perf_counter() - start
+
+class Pipeline(object):
+	def __init__(self, fetch_workers=None, parse_workers=None, queue_size=None, cache=None, sessions=None, limiter=None):
+		self.fetch_workers = fetch_workers or Options.WORKERS
+		self.parse_workers = parse_workers
+		self.queue_size = queue_size or Options.QUEUE_SIZE
+		self.cache = cache
+		self.sessions = sessions
+		self.limiter = limiter
+
+		self.timings = {'fetch':0.0, 'parse':0.0, 'queue':0.0}
+		self._lock = threading.Lock()
+
+	def run(self, credentials):
+		students = [Student(login=login, password=password) for login, password in credentials]
+		slots = threading.BoundedSemaphore(self.queue_size)
+
+		with ThreadPoolExecutor(max_workers=self.fetch_workers) as fetchers, ProcessPoolExecutor(max_workers=self.parse_workers) as parsers:
+			fetches = [fetchers.submit(self.fetch, student, slots, parsers) for student in students]
+
+			for student, fetch in zip(students, fetches):
+				parse = fetch.result()
+				if parse is None:
+					continue
+				student.name, student.marks, elapsed = parse.result()
+				self.timings['parse'] += elapsed
+
+		return students
+
+	def fetch(self, student, slots, parsers):
+		start = time.perf_counter()
+		slots.acquire()
+		queued = time.perf_counter()
+
+		try:
+			browser = Browser(cache=self.cache, sessions=self.sessions, limiter=self.limiter)
+			if not browser.login(student):
+				slots.release()
+				return None
+			html = browser.fetch_page_content()
+		except requests.RequestException:
+			slots.release()
+			return None
+		except BaseException:
+			slots.release()
+			raise
+
+		with self._lock:
+			self.timings['queue'] += queued - start
+			self.timings['fetch'] += time.perf_counter() - queued
+
+		parse = parsers.submit(parse_grades, html, browser.parser)
+		parse.add_done_callback(lambda future: slots.release())
+		return parse
@@ -0,0 +1,45 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+from options import Options
+
+class SessionStore(object):
+	def __init__(self, path=None):
+		self.path = path or Options.SESSION_FILE
+		self._lock = threading.Lock()
+
+		try:
+			with open(self.path, encoding='utf-8') as file:
+				self._sessions = json.load(file)
+		except (OSError, ValueError):
+			self._sessions = {}
+
+	@staticmethod
+	def _key(login):
+		return hashlib.sha256(login.encode()).hexdigest()
+
+	def load(self, login):
+		return self._sessions.get(self._key(login))
+
+	def save(self, login, cookies):
+		with self._lock:
+			self._sessions[self._key(login)] = cookies
+			self._dump()
+
+	def drop(self, login):
+		with self._lock:
+			if self._sessions.pop(self._key(login), None) is not None:
+				self._dump()
+
+	def _dump(self):
+		descriptor, path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(self.path)), prefix='.sessions-')
+		try:
+			with os.fdopen(descriptor, 'w', encoding='utf-8') as file:
+				json.dump(self._sessions, file)
+			os.replace(path, self.path)
+		except BaseException:
+			os.remove(path)
+			raise
@@ -0,0 +1,108 @@
+import datetime
+import sqlite3
+import threading
+import time
+
+from options import Options
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS grades (
+	login TEXT NOT NULL,
+	subject TEXT NOT NULL,
+	position INTEGER NOT NULL,
+	value INTEGER NOT NULL,
+	scraped_at REAL NOT NULL,
+	PRIMARY KEY (login, subject, position)
+);
+CREATE INDEX IF NOT EXISTS grades_scraped_at ON grades (scraped_at);
+CREATE INDEX IF NOT EXISTS grades_login_scraped_at ON grades (login, scraped_at);
+'''
+
+# SQLite limits the number of parameters of one statement
+BATCH_SIZE = 500
+
+class SnapshotStore(object):
+	def __init__(self, path=None):
+		self.path = path or Options.STORE_PATH
+		self._lock = threading.Lock()
+
+		self._connection = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+		self._connection.execute('PRAGMA journal_mode=WAL')
+		self._connection.execute('PRAGMA synchronous=NORMAL')
+		self._connection.executescript(SCHEMA)
+
+	def save(self, student):
+		return self.save_roster([student])
+
+	def save_roster(self, students):
+		scraped_at = time.time()
+		added = 0
+
+		with self._lock:
+			cursor = self._connection.cursor()
+			cursor.execute('BEGIN IMMEDIATE')
+			try:
+				for student in students:
+					if student.marks is not None:
+						added += self._save_student(cursor, student, scraped_at)
+			except BaseException:
+				cursor.execute('ROLLBACK')
+				raise
+			cursor.execute('COMMIT')
+		return added
+
+	def _save_student(self, cursor, student, scraped_at):
+		stored = {}
+		for subject, value in cursor.execute('SELECT subject, value FROM grades WHERE login = ? ORDER BY subject, position', (student.login,)):
+			stored.setdefault(subject, []).append(value)
+
+		rows = []
+		for mark in student.marks:
+			values = list(mark.values)
+			previous = stored.get(mark.subject, [])
+			if len(previous) > len(values):
+				cursor.execute('DELETE FROM grades WHERE login = ? AND subject = ? AND position >= ?', (student.login, mark.subject, len(values)))
+
+			# A regraded mark replaces only its own position
+			positions = [position for position, value in enumerate(previous[:len(values)]) if value != values[position]]
+			positions.extend(range(len(previous), len(values)))
+			rows.extend((student.login, mark.subject, position, values[position], scraped_at) for position in positions)
+
+		cursor.executemany('INSERT OR REPLACE INTO grades VALUES (?, ?, ?, ?, ?)', rows)
+		return len(rows)
+
+	def history(self, login):
+		with self._lock:
+			rows = self._connection.execute('SELECT subject, value FROM grades WHERE login = ? ORDER BY subject, position', (login,)).fetchall()
+
+		history = {}
+		for subject, value in rows:
+			history.setdefault(subject, []).append(value)
+		return history
+
+	def added_since(self, since, logins=None):
+		if isinstance(since, datetime.date) and not isinstance(since, datetime.datetime):
+			since = datetime.datetime.combine(since, datetime.time())
+		if isinstance(since, datetime.datetime):
+			since = since.timestamp()
+
+		query = 'SELECT login, subject, position, value, scraped_at FROM grades WHERE scraped_at >= ?'
+		order = ' ORDER BY scraped_at, login, subject, position'
+		if logins is None:
+			with self._lock:
+				return self._connection.execute(query + order, (since,)).fetchall()
+
+		logins = sorted(set(logins))
+		rows = []
+		with self._lock:
+			for start in range(0, len(logins), BATCH_SIZE):
+				batch = logins[start:start + BATCH_SIZE]
+				rows.extend(self._connection.execute(f'{query} AND login IN ({", ".join("?" * len(batch))}){order}', (since, *batch)))
+
+		if len(logins) > BATCH_SIZE:
+			rows.sort(key=lambda row: (row[4], row[0], row[1], row[2]))
+		return rows
+
+	def close(self):
+		with self._lock:
+			self._connection.close()
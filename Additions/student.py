@@ -1,4 +1,6 @@
 class Student(object):
+	__slots__ = ('login', 'password', 'name', 'marks', 'mean')
+
 	def __init__(self, login, password):
 		self.login = login
 		self.password = password
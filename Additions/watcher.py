@@ -0,0 +1,101 @@
+import hashlib
+import time
+
+from Additions.browser import parse_page, parse_student_marks, parse_student_name
+from Additions.report import StudentReport, render, render_row
+from options import Options
+
+class Watcher(object):
+	def __init__(self, manager, interval=None, jitter=None):
+		self.manager = manager
+		self.browser = manager.browser
+		self.interval = Options.WATCH_INTERVAL if interval is None else interval
+		self.jitter = Options.WATCH_JITTER if jitter is None else jitter
+
+		self.digest = None
+		self.authorized = True
+		self.polls = 0
+		self.short_circuits = 0
+		self.rerendered = 0
+		self.latency = 0
+		self.total_latency = 0
+
+		report = manager.analyze()
+		self.name = report.name
+		self.rows = {subject.subject:(subject.values, render_row(subject)) for subject in report.subjects}
+
+	def poll(self):
+		start = time.monotonic()
+		try:
+			response = self.browser.request('GET', f'{Options.URL}?module=grades')
+			digest = hashlib.sha256(response.content).hexdigest()
+			self.polls += 1
+			if digest == self.digest:
+				self.short_circuits += 1
+				return None
+
+			page_content = parse_page(response.text, self.browser.parser)
+			if not page_content.find_all("div", {"class":"top-panel-name"}):
+				self.digest = None
+				self.browser.logout()
+				self.authorized = self.browser.login(self.manager.student)
+				self.browser.response = self.browser.entry = None
+				return None
+			self.digest = digest
+
+			student = self.manager.student
+			student.name = parse_student_name(page_content)
+			student.marks = parse_student_marks(page_content)
+			return self.update(StudentReport(student))
+		finally:
+			self.latency = time.monotonic() - start
+			self.total_latency += self.latency
+
+	def update(self, report):
+		rows = {}
+		view = []
+		changed = False
+		for subject in report.subjects:
+			cached = self.rows.get(subject.subject)
+			if cached is None or cached[0] != subject.values:
+				cached = (subject.values, render_row(subject))
+				self.rerendered += 1
+				changed = True
+			rows[subject.subject] = cached
+			view.append(cached[1])
+
+		changed = changed or rows.keys() != self.rows.keys() or report.name != self.name
+		self.rows = rows
+		self.name = report.name
+		self.manager.update_report(report)
+		if not changed:
+			return None
+		return render(report, view)
+
+	def delay(self):
+		import random
+
+		return max(0, self.interval * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+	def run(self, output=print, log=None):
+		import requests
+
+		while True:
+			try:
+				view = self.poll()
+			except requests.RequestException as error:
+				if log is not None:
+					log(f'Ошибка сети: {error}')
+			else:
+				if not self.authorized:
+					return
+				if view is not None:
+					output(view)
+				if log is not None:
+					log(self.report())
+			time.sleep(self.delay())
+
+	def report(self):
+		rate = self.short_circuits / self.polls * 100 if self.polls else 0
+		mean = self.total_latency / self.polls if self.polls else 0
+		return f'Опросов: {self.polls}, без изменений: {self.short_circuits} ({rate:.0f}%), задержка: {self.latency:.2f} с (в среднем {mean:.2f} с), перерисовано предметов: {self.rerendered}'
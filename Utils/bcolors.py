@@ -8,8 +8,16 @@ class BColors:
 	ENDC = '\033[0m'
 	BOLD = '\033[1m'
 
-def mark_to_colored(mark):
+class NoColors:
+	GREEN = ''
+	RED = ''
+	YELLOW = ''
+	MAGENTA = ''
+	ENDC = ''
+	BOLD = ''
+
+def mark_to_colored(mark, colors=BColors):
 	if Options.EXCELLENT_MARK > mark > 0:
-		return f'{BColors.RED}{mark}{BColors.ENDC}'
+		return f'{colors.RED}{mark}{colors.ENDC}'
 	else:
-		return f'{BColors.GREEN}{mark}{BColors.ENDC}'
+		return f'{colors.GREEN}{mark}{colors.ENDC}'
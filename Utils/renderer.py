@@ -0,0 +1,56 @@
+from Utils.bcolors import BColors, NoColors
+from options import Options
+
+class Renderer(object):
+	def __init__(self, color=True):
+		self.colors = BColors if color else NoColors
+		self.tokens = {value:self.token(value) for value in range(Options.MAX_MARK + 1)}
+		self.empty = f'{self.colors.YELLOW}-{self.colors.ENDC}'
+
+	def token(self, value):
+		if value == Options.MAX_MARK:
+			color = self.colors.MAGENTA
+		elif value < Options.EXCELLENT_MARK:
+			color = self.colors.RED
+		else:
+			color = self.colors.GREEN
+		return f'{color}{value}{self.colors.ENDC} '
+
+	def marks(self, values):
+		if len(values) == 0:
+			return self.empty
+
+		tokens = self.tokens
+		return ''.join([tokens[value] if value in tokens else self.token(value) for value in values])
+
+	def subject(self, subject, mean):
+		if mean == 0 or mean >= Options.EXCELLENT_MARK:
+			return f'{self.colors.GREEN}{subject}{self.colors.ENDC}'
+		return f'{self.colors.RED}{subject}{self.colors.ENDC}'
+
+	def mean(self, mean):
+		if mean == 0:
+			return self.empty
+		elif mean < Options.EXCELLENT_MARK:
+			return f'{self.colors.RED}{format(mean, ".2f")}{self.colors.ENDC}'
+		return f'{self.colors.GREEN}{format(mean, ".2f")}{self.colors.ENDC}'
+
+	def access(self, marks_number, access):
+		if marks_number == 0:
+			return self.empty
+		elif access is None:
+			return f'{self.colors.RED}недостижимо{self.colors.ENDC}'
+		elif access > 0:
+			return f'{self.colors.RED}{access}{self.colors.ENDC}'
+		return f'{self.colors.GREEN}{access}{self.colors.ENDC}'
+
+	def marks_number(self, marks_number):
+		if marks_number == 0:
+			return f'{self.colors.YELLOW}{marks_number}{self.colors.ENDC}'
+		return f'{self.colors.GREEN}{marks_number}{self.colors.ENDC}'
+
+active = Renderer()
+
+def setup(color=True):
+	global active
+	active = Renderer(color)
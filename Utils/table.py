@@ -1,11 +1,8 @@
 #!/usr/bin/env python
-import copy
+import functools
+import heapq
 import math
-import random
 import re
-import textwrap
-
-import wcwidth
 
 FRAME = 0
 ALL = 1
@@ -21,6 +18,7 @@ RANDOM = 20
 
 _re = re.compile(r"\033\[[0-9;]*m")
 
+@functools.lru_cache(maxsize=65536)
 def _get_size(text):
     lines = text.split("\n")
     height = len(lines)
@@ -33,6 +31,9 @@ class Table:
 
         self._field_names = []
         self._rows = []
+        self._data_widths = None
+        self._data_formats = None
+        self._sort_cache = {}
         self.align = {}
         self.valign = {}
         self.max_width = {}
@@ -159,8 +160,6 @@ class Table:
     def get_string(self, **kwargs):
         options = self._get_options(kwargs)
 
-        lines = []
-
         if self.rowcount == 0 and (not options["print_empty"] or not options["border"]):
             return ""
 
@@ -168,31 +167,61 @@ class Table:
 
         formatted_rows = self._format_rows(rows, options)
 
-        self._compute_widths(formatted_rows, options)
+        if self._renders_all_rows(options):
+            self._compute_widths(None, options)
+        else:
+            self._compute_widths(formatted_rows, options)
+
+        return "\n".join(self._iter_lines(formatted_rows, options))
+
+    def iter_lines(self, widths=None, **kwargs):
+        options = self._get_options(kwargs)
+
+        if self.rowcount == 0 and (not options["print_empty"] or not options["border"]):
+            return
+
+        rows = self._get_rows(options)
+
+        # Widths come from a cheap first pass unless the caller already knows them
+        if widths is None and self._renders_all_rows(options):
+            self._compute_widths(None, options)
+        elif widths is None:
+            self._compute_widths((self._format_row(row, options) for row in rows), options)
+        else:
+            self._widths = list(widths)
+
+        yield from self._iter_lines((self._format_row(row, options) for row in rows), options)
+
+    def write_to(self, fp, widths=None, **kwargs):
+        for line in self.iter_lines(widths, **kwargs):
+            fp.write(line)
+            fp.write("\n")
+
+    def _iter_lines(self, formatted_rows, options):
+        if "orgmode" in self.__dict__ and self.orgmode is True:
+            for chunk in self._iter_chunks(formatted_rows, options):
+                for line in chunk.split("\n"):
+                    yield "|" + line[1:-1] + "|"
+        else:
+            yield from self._iter_chunks(formatted_rows, options)
+
+    def _iter_chunks(self, formatted_rows, options):
         self._hrule = self._stringify_hrule(options)
 
         title = options["title"] or self._title
         if title:
-            lines.append(self._stringify_title(title, options))
+            yield self._stringify_title(title, options)
 
         if options["header"]:
-            lines.append(self._stringify_header(options))
+            yield self._stringify_header(options)
         elif options["border"] and options["hrules"] in (ALL, FRAME):
-            lines.append(self._hrule)
+            yield self._hrule
 
         for row in formatted_rows:
-            lines.append(self._stringify_row(row, options))
+            yield self._stringify_row(row, options)
 
         if options["border"] and options["hrules"] == FRAME:
-            lines.append(self._hrule)
-
-        if "orgmode" in self.__dict__ and self.orgmode is True:
-            tmp = list()
-            for line in lines:
-                tmp.extend(line.split("\n"))
-            lines = ["|" + line[1:-1] + "|" for line in tmp]
-
-        return "\n".join(lines)
+            yield self._hrule
 
     def __str__(self):
         return self.get_string()
@@ -203,7 +232,10 @@ class Table:
         elif option in ("start", "end", "max_width", "min_width", "min_table_width", "max_table_width", "padding_width", "left_padding_width", "right_padding_width", "format",):
             self._validate_nonnegative_int(option, val)
         elif option == "sortby":
-            self._validate_field_name(option, val)
+            if isinstance(val, (list, tuple)):
+                self._validate_all_field_names(option, val)
+            else:
+                self._validate_field_name(option, val)
         elif option == "sort_key":
             self._validate_function(option, val)
         elif option == "hrules":
@@ -351,6 +383,7 @@ class Table:
         if self._field_names:
             old_names = self._field_names[:]
         self._field_names = val
+        self._data_widths = None
         if self._align and old_names:
             for old_name, new_name in zip(old_names, val):
                 self._align[new_name] = self._align[old_name]
@@ -741,6 +774,8 @@ class Table:
         self.right_padding_width = 8
 
     def _set_random_style(self):
+        import random
+
         self.header = random.choice((True, False))
         self.border = random.choice((True, False))
         self._hrules = random.choice((ALL, FRAME, HEADER, NONE))
@@ -758,6 +793,40 @@ class Table:
         if not self._field_names:
             self.field_names = [f"Field {n + 1}" for n in range(0, len(row))]
         self._rows.append(list(row))
+        self._sort_cache = {}
+        if self._data_widths is not None:
+            self._update_data_widths(self._rows[-1])
+
+    def del_row(self, row_index):
+        if row_index > len(self._rows) - 1:
+            raise Exception(f"Can't delete row at index {row_index}, table only has {len(self._rows)} rows!")
+        del self._rows[row_index]
+        self._data_widths = None
+        self._sort_cache = {}
+
+    def clear_rows(self):
+        self._rows = []
+        self._data_widths = None
+        self._sort_cache = {}
+
+    def _renders_all_rows(self, options):
+        return not options["start"] and (options["end"] is None or options["end"] >= len(self._rows))
+
+    def _get_data_widths(self):
+        # Widths of the formatted cells over all rows, kept up to date by add_row
+        formats = (dict(self._int_format), dict(self._float_format))
+        if self._data_widths is None or self._data_formats != formats:
+            self._data_formats = formats
+            self._data_widths = len(self._field_names) * [0]
+            for row in self._rows:
+                self._update_data_widths(row)
+        return self._data_widths
+
+    def _update_data_widths(self, row):
+        for index, value in enumerate(self._format_row(row, None)):
+            width = _get_size(value)[0]
+            if width > self._data_widths[index]:
+                self._data_widths[index] = width
 
     def _format_value(self, field, value):
         if isinstance(value, int) and field in self._int_format:
@@ -780,13 +849,18 @@ class Table:
         else:
             widths = len(self.field_names) * [0]
 
-        for row in rows:
-            for index, value in enumerate(row):
+        if rows is None:
+            rows_widths = [self._get_data_widths()] if self._rows else []
+        else:
+            rows_widths = ([_get_size(value)[0] for value in row] for row in rows)
+
+        for row_widths in rows_widths:
+            for index, width in enumerate(row_widths):
                 fieldname = self.field_names[index]
                 if fieldname in self.max_width:
-                    widths[index] = max(widths[index], min(_get_size(value)[0], self.max_width[fieldname]), )
+                    widths[index] = max(widths[index], min(width, self.max_width[fieldname]), )
                 else:
-                    widths[index] = max(widths[index], _get_size(value)[0])
+                    widths[index] = max(widths[index], width)
                 if fieldname in self.min_width:
                     widths[index] = max(widths[index], self.min_width[fieldname])
         self._widths = widths
@@ -825,22 +899,57 @@ class Table:
         return lpad, rpad
 
     def _get_rows(self, options):
+        if not options["sortby"] and not options["start"] and options["end"] is None:
+            return self._rows
+
         if options["oldsortslice"]:
-            rows = copy.deepcopy(self._rows[options["start"]: options["end"]])
+            rows = self._rows[options["start"]: options["end"]]
         else:
-            rows = copy.deepcopy(self._rows)
+            rows = self._rows
 
         if options["sortby"]:
-            sortindex = self._field_names.index(options["sortby"])
-            rows = [[row[sortindex]] + row for row in rows]
-            rows.sort(reverse=options["reversesort"], key=options["sort_key"])
-            rows = [row[1:] for row in rows]
+            rows = [rows[index] for index in self._get_order(rows, options)]
 
         if not options["oldsortslice"]:
             rows = rows[options["start"]: options["end"]]
 
         return rows
 
+    def _get_order(self, rows, options):
+        sortby = options["sortby"]
+        if isinstance(sortby, str):
+            sortby = [sortby]
+        sortindexes = tuple(self._field_names.index(field) for field in sortby)
+        sort_key = options["sort_key"]
+
+        # Only the first end rows are shown, so a partial selection is enough
+        limit = None
+        if not options["oldsortslice"] and options["end"] is not None and options["end"] < len(rows):
+            limit = options["end"]
+
+        # Only the latest order is kept for every set of sort fields, so the
+        # cache can not grow with each new sort_key callable
+        cache_key = (options["reversesort"], sort_key, options["oldsortslice"] and (options["start"], options["end"]))
+        cached = self._sort_cache.get(sortindexes)
+        if cached is not None and cached[0] == cache_key:
+            if cached[1] is None:
+                return cached[2][:limit]
+            if cached[1] == limit:
+                return cached[2]
+
+        def key(index):
+            return sort_key([rows[index][sortindex] for sortindex in sortindexes] + rows[index])
+
+        if limit is None:
+            order = sorted(range(len(rows)), reverse=options["reversesort"], key=key)
+        elif options["reversesort"]:
+            order = heapq.nlargest(limit, range(len(rows)), key=key)
+        else:
+            order = heapq.nsmallest(limit, range(len(rows)), key=key)
+
+        self._sort_cache[sortindexes] = (cache_key, limit, order)
+        return order
+
     def _format_row(self, row, options):
         return [self._format_value(field, value) for (field, value) in zip(self._field_names, row)]
 
@@ -938,8 +1047,10 @@ class Table:
         return "".join(bits)
 
     def _stringify_row(self, row, options):
+        import textwrap
 
-        for (index, field, value, width) in zip(range(0, len(row)), self._field_names, row, self._widths):
+        wrapped = []
+        for (value, width) in zip(row, self._widths):
             # Enforce max widths
             lines = value.split("\n")
             new_lines = []
@@ -947,9 +1058,8 @@ class Table:
                 if _str_block_width(line) > width:
                     line = textwrap.fill(line, width)
                 new_lines.append(line)
-            lines = new_lines
-            value = "\n".join(lines)
-            row[index] = value
+            wrapped.append("\n".join(new_lines))
+        row = wrapped
 
         row_height = 0
         for c in row:
@@ -1008,4 +1118,12 @@ class Table:
         return "\n".join(bits)
 
 def _str_block_width(val):
+    # Plain ASCII has no escapes and no wide characters
+    if val.isascii() and val.isprintable():
+        return len(val)
+    return _wide_block_width(val)
+
+@functools.lru_cache(maxsize=65536)
+def _wide_block_width(val):
+    import wcwidth
     return wcwidth.wcswidth(_re.sub("", val))
@@ -1,12 +1,15 @@
-import statistics
+from options import Options
 
-def access(values):
-	mean = statistics.mean(values)
-	access_value = 0
+def assumed_mark(target):
+	if Options.ASSUMED_MARK > target:
+		return Options.ASSUMED_MARK
+	return Options.MAX_MARK
 
-	while mean < 8:
-		values.append(9)
-		mean = statistics.mean(values)
-		access_value += 1
+def access(total, count, target=8, filler=9):
+	if count == 0 or total >= target * count:
+		return 0
 
-	return access_value
+	if filler <= target:
+		return None
+
+	return -(-(target * count - total) // (filler - target))
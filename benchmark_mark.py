@@ -0,0 +1,42 @@
+import argparse
+import random
+import statistics
+import time
+
+from Additions.mark import Mark
+
+MARKS = 10000
+
+class LegacyMark(object):
+	def __init__(self, subject):
+		self.subject = subject
+		self.values = []
+		self.marks_number = 0
+		self.mean = 0
+
+	def add_mark(self, mark):
+		self.values.append(int(mark))
+		self.marks_number = len(self.values)
+		self.mean = round(statistics.mean(self.values), 2)
+
+def build(cls, values):
+	start = time.perf_counter()
+	mark = cls('Алгебра')
+	for value in values:
+		mark.add_mark(value)
+	return mark, time.perf_counter() - start
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure how long it takes to add the marks of one subject')
+	parser.add_argument('--marks', type=int, default=MARKS, help='number of marks in the subject')
+	args = parser.parse_args()
+
+	values = [random.randint(0, 10) for _ in range(args.marks)]
+	legacy, legacy_time = build(LegacyMark, values)
+	mark, mark_time = build(Mark, values)
+	if legacy.mean != mark.mean or legacy.marks_number != mark.marks_number:
+		raise Exception('The results differ!')
+
+	print(f'{args.marks} marks')
+	print(f'statistics.mean on every mark: {legacy_time * 1000:10.1f} ms')
+	print(f'running statistics:            {mark_time * 1000:10.1f} ms ({legacy_time / mark_time:.0f}x faster)')
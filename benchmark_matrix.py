@@ -0,0 +1,63 @@
+import argparse
+import random
+import statistics
+import time
+
+from Additions.mark import Mark
+from Additions.matrix import GradeMatrix
+from Additions.student import Student
+from options import Options
+
+STUDENTS = 100000
+SUBJECTS = 12
+MARKS = 15
+
+def roster(students, subjects, marks):
+	rng = random.Random(0)
+	result = []
+	for index in range(students):
+		student = Student(f'student{index}', 'password')
+		student.marks = []
+		for subject in range(subjects):
+			mark = Mark(f'Предмет {subject}')
+			for _ in range(marks):
+				mark.add_mark(rng.randint(0, Options.MAX_MARK))
+			student.marks.append(mark)
+		result.append(student)
+	return result
+
+def loop(students):
+	marks = [mark for student in students for mark in student.marks]
+	means = [mark.mean for mark in marks]
+	access = [mark.access for mark in marks]
+	student_means = []
+	for student in students:
+		graded = [mark.mean for mark in student.marks if mark.mean != 0]
+		student_means.append(round(statistics.mean(graded), 2) if graded else 0)
+	return means, access, student_means
+
+def matrix(students):
+	grades = GradeMatrix(students)
+	return grades.means().tolist(), grades.access().tolist(), grades.student_means().tolist()
+
+def measure(function, students):
+	start = time.perf_counter()
+	result = function(students)
+	return result, time.perf_counter() - start
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure the school-wide averages computed mark by mark and with GradeMatrix')
+	parser.add_argument('--students', type=int, default=STUDENTS, help='number of students')
+	parser.add_argument('--subjects', type=int, default=SUBJECTS, help='number of subjects of every student')
+	parser.add_argument('--marks', type=int, default=MARKS, help='number of marks in every subject')
+	args = parser.parse_args()
+
+	students = roster(args.students, args.subjects, args.marks)
+	legacy, legacy_time = measure(loop, students)
+	result, result_time = measure(matrix, students)
+	if legacy != result:
+		raise Exception('The results differ!')
+
+	print(f'{args.students} students, {args.subjects} subjects, {args.marks} marks each')
+	print(f'mark by mark: {legacy_time * 1000:10.1f} ms')
+	print(f'GradeMatrix:  {result_time * 1000:10.1f} ms ({legacy_time / result_time:.1f}x faster)')
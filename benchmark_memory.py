@@ -0,0 +1,85 @@
+import argparse
+import gc
+import random
+import statistics
+import tracemalloc
+
+from Additions.mark import Mark
+from Additions.student import Student
+from Utils.bcolors import BColors
+from options import Options
+
+STUDENTS = 100000
+SUBJECTS = 12
+MARKS = 15
+
+class LegacyMark(object):
+	# The attributes the old Mark kept after gen_view(), filled in directly
+	# because building them mark by mark takes hours for a whole school
+	def __init__(self, subject, values):
+		self.subject = subject
+		self.values = list(values)
+		self.marks_number = len(self.values)
+		self.mean = round(statistics.mean(self.values), 2) if self.values else 0
+		self.access = 0
+
+		colors = [BColors.MAGENTA if value == Options.MAX_MARK else BColors.RED if value < Options.EXCELLENT_MARK else BColors.GREEN for value in self.values]
+		color = BColors.RED if self.mean < Options.EXCELLENT_MARK else BColors.GREEN
+		self.view_subject = f'{color}{self.subject}{BColors.ENDC}'
+		self.view_marks = ''.join(f'{value_color}{value}{BColors.ENDC} ' for value_color, value in zip(colors, self.values))
+		self.view_mean = f'{color}{format(self.mean, ".2f")}{BColors.ENDC}'
+		self.view_marks_number = f'{BColors.GREEN}{self.marks_number}{BColors.ENDC}'
+		self.view_access = f'{color}{self.access}{BColors.ENDC}'
+
+class LegacyStudent(object):
+	def __init__(self, login, password):
+		self.login = login
+		self.password = password
+		self.name = ''
+		self.marks = None
+		self.mean = 0
+
+def dataset(students, subjects, marks):
+	rng = random.Random(0)
+	for index in range(students):
+		yield f'student{index}', [(f'Предмет {subject}', [rng.randint(0, Options.MAX_MARK) for _ in range(marks)]) for subject in range(subjects)]
+
+def legacy_student(login, subjects):
+	student = LegacyStudent(login, 'password')
+	student.marks = [LegacyMark(subject, values) for subject, values in subjects]
+	return student
+
+def compact_student(login, subjects):
+	student = Student(login, 'password')
+	student.marks = []
+	for subject, values in subjects:
+		mark = Mark(subject)
+		for value in values:
+			mark.add_mark(value)
+		student.marks.append(mark)
+	return student
+
+def measure(build, args):
+	gc.collect()
+	tracemalloc.start()
+	students = [build(login, subjects) for login, subjects in dataset(args.students, args.subjects, args.marks)]
+	size, peak = tracemalloc.get_traced_memory()
+	tracemalloc.stop()
+
+	del students
+	gc.collect()
+	return size / args.students, peak / args.students
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure the memory used by the grades of every student')
+	parser.add_argument('--students', type=int, default=STUDENTS, help='number of students')
+	parser.add_argument('--subjects', type=int, default=SUBJECTS, help='number of subjects of every student')
+	parser.add_argument('--marks', type=int, default=MARKS, help='number of marks in every subject')
+	args = parser.parse_args()
+
+	legacy, legacy_peak = measure(legacy_student, args)
+	compact, compact_peak = measure(compact_student, args)
+
+	print(f'{args.students} students, {args.subjects} subjects, {args.marks} marks each')
+	print(f'lists and rendered strings: {legacy:8.0f} bytes per student (peak {legacy_peak:.0f})')
+	print(f'arrays and __slots__:       {compact:8.0f} bytes per student (peak {compact_peak:.0f}), {legacy / compact:.1f}x less')
@@ -0,0 +1,84 @@
+import argparse
+import os
+import random
+import time
+
+import bs4
+
+from Additions.browser import parse_page, parse_student_marks, parse_student_name
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests', 'fixtures')
+GRADES = ['grades.html', 'grades_large.html']
+SUBJECTS = 100
+MARKS = 50
+RUNS = 5
+BACKENDS = ['html.parser', 'lxml']
+
+def legacy_parse(html):
+	page_content = bs4.BeautifulSoup(html, 'html.parser')
+	rows = page_content.find_all("tr", {"class":"cl-row"})
+
+	subjects_number = 0
+	while True:
+		try:
+			float(rows[subjects_number].find_all('td')[0].getText())
+			subjects_number += 1
+		except ValueError:
+			break
+
+	marks = []
+	for i, tr in enumerate(rows[subjects_number:subjects_number * 2]):
+		values = []
+		for td in tr.find_all('td'):
+			if td.find('span') is not None and len(td.find('span')) != 0:
+				values.append(int(td.find('span').getText()))
+		marks.append((rows[i].find_all('td')[1].getText(), values))
+
+	return page_content.find_all("div", {"class":"top-panel-name"})[0].getText(), marks
+
+def parse(html, parser):
+	page_content = parse_page(html, parser)
+	return parse_student_name(page_content), [(mark.subject, list(mark.values)) for mark in parse_student_marks(page_content)]
+
+def generate(subjects, marks):
+	rows = [f'<tr class="cl-row"><td>{index + 1}</td><td>Предмет {index + 1}</td></tr>' for index in range(subjects)]
+	for _ in range(subjects):
+		cells = ''.join(f'<td><span>{random.randint(0, 10)}</span></td>' if random.random() < 0.7 else '<td></td>' for _ in range(marks))
+		rows.append(f'<tr class="cl-row"><td>Оценки</td>{cells}</tr>')
+	rows.append('<tr class="cl-row"><td>Итого</td><td></td></tr>')
+	return f'<html><body><div class="top-panel-name">Иванов Иван</div><table class="cl-table">{"".join(rows)}</table></body></html>'
+
+def measure(function, html, runs):
+	result = function(html)
+	start = time.perf_counter()
+	for _ in range(runs):
+		function(html)
+	return result, (time.perf_counter() - start) / runs
+
+def read(name):
+	with open(os.path.join(FIXTURES, name), encoding='utf-8') as file:
+		return file.read()
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure how long it takes to parse the grades page')
+	parser.add_argument('--subjects', type=int, default=SUBJECTS, help='number of subjects on the generated page')
+	parser.add_argument('--marks', type=int, default=MARKS, help='number of cells in every row of the generated page')
+	parser.add_argument('--runs', type=int, default=RUNS, help='number of measurements')
+	args = parser.parse_args()
+
+	pages = [(name, read(name)) for name in GRADES]
+	pages.append((f'{args.subjects}x{args.marks}', generate(args.subjects, args.marks)))
+
+	for name, html in pages:
+		legacy, legacy_time = measure(legacy_parse, html, args.runs)
+
+		print(f'{name} ({len(html) // 1024} KB)')
+		print(f'  find() on every row:        {legacy_time * 1000:8.1f} ms')
+		for backend in BACKENDS:
+			if not bs4.builder_registry.lookup(backend):
+				print(f'  single pass, {backend + ":":14} not installed')
+				continue
+			result, result_time = measure(lambda html: parse(html, backend), html, args.runs)
+			if legacy != result:
+				raise Exception(f'The results of {backend} differ on {name}!')
+			print(f'  single pass, {backend + ":":14} {result_time * 1000:8.1f} ms ({legacy_time / result_time:.1f}x faster)')
@@ -0,0 +1,50 @@
+import argparse
+import random
+import time
+from array import array
+
+from Utils.bcolors import BColors
+from Utils.renderer import Renderer
+from options import Options
+
+GRADES = 1000000
+SUBJECTS = 1000
+
+def legacy_marks(values):
+	view_marks = ''
+	if len(values) == 0:
+		view_marks = f'{BColors.YELLOW}-{BColors.ENDC}'
+	else:
+		for value in values:
+			if value == Options.MAX_MARK:
+				view_marks += f'{BColors.MAGENTA}{str(value)}{BColors.ENDC} '
+			elif value < Options.EXCELLENT_MARK:
+				view_marks += f'{BColors.RED}{str(value)}{BColors.ENDC} '
+			else:
+				view_marks += f'{BColors.GREEN}{str(value)}{BColors.ENDC} '
+	return view_marks
+
+def measure(render, subjects):
+	start = time.perf_counter()
+	views = [render(values) for values in subjects]
+	return views, time.perf_counter() - start
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure how long it takes to render the grades')
+	parser.add_argument('--grades', type=int, default=GRADES, help='number of grades')
+	parser.add_argument('--subjects', type=int, default=SUBJECTS, help='number of subjects the grades are split into')
+	args = parser.parse_args()
+
+	size = args.grades // args.subjects
+	subjects = [array('b', (random.randint(0, Options.MAX_MARK) for _ in range(size))) for _ in range(args.subjects)]
+
+	legacy, legacy_time = measure(legacy_marks, subjects)
+	colored, colored_time = measure(Renderer(color=True).marks, subjects)
+	plain, plain_time = measure(Renderer(color=False).marks, subjects)
+	if legacy != colored:
+		raise Exception('The results differ!')
+
+	print(f'{size * args.subjects} grades in {args.subjects} subjects')
+	print(f'f-string on every grade: {legacy_time * 1000:8.1f} ms')
+	print(f'token table:             {colored_time * 1000:8.1f} ms ({legacy_time / colored_time:.1f}x faster)')
+	print(f'token table, no color:   {plain_time * 1000:8.1f} ms ({legacy_time / plain_time:.1f}x faster)')
@@ -0,0 +1,67 @@
+import argparse
+import time
+
+from Additions.limiter import RateLimiter
+from Additions.manager import Manager
+from Additions.roster import Pipeline, fetch_roster
+from Additions.student import Student
+from options import Options
+from tests.cabinet import CabinetServer
+
+STUDENTS = 100
+DELAY = 0.05
+CONGESTION = 0.01
+WORKERS = 8
+
+def sequential(credentials, args):
+	return [Manager(Student(login=login, password=password), strict=False).student for login, password in credentials]
+
+def threads(credentials, args):
+	return [manager.student for manager in fetch_roster(credentials, workers=args.workers)]
+
+def limited(credentials, args):
+	# The limit is halved once the cabinet answers three times slower than when idle
+	limiter = RateLimiter(rate=1000, burst=args.workers, max_concurrency=args.workers, target_latency=args.delay * 3)
+	try:
+		return [manager.student for manager in fetch_roster(credentials, workers=args.workers, limiter=limiter)]
+	finally:
+		metrics = limiter.metrics()
+		print(f'  limit at the end: {metrics["limit"]}, cuts: {metrics["decreases"]}, waited: {metrics["waited"]:.2f} s')
+
+def pipeline(credentials, args):
+	return Pipeline(fetch_workers=args.workers).run(credentials)
+
+MODES = [
+	('one student after another', sequential),
+	('fetch_roster', threads),
+	('fetch_roster, RateLimiter', limited),
+	('Pipeline', pipeline),
+]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure how many students are fetched per second from a local copy of the cabinet')
+	parser.add_argument('--students', type=int, default=STUDENTS, help='number of students')
+	parser.add_argument('--delay', type=float, default=DELAY, help='time the cabinet takes to answer in seconds')
+	parser.add_argument('--congestion', type=float, default=CONGESTION, help='extra time of every answer for each other request being served')
+	parser.add_argument('--workers', type=int, default=WORKERS, help='number of threads fetching the pages')
+	args = parser.parse_args()
+
+	server = CabinetServer(delay=args.delay, congestion=args.congestion).start()
+	Options.URL = server.url
+	credentials = [(f'student{index}', 'password') for index in range(args.students)]
+
+	print(f'{args.students} students, {args.delay * 1000:.0f} ms per answer and {args.congestion * 1000:.0f} ms for each other request, {args.workers} workers')
+	baseline = None
+	try:
+		for name, run in MODES:
+			print(name)
+			start = time.perf_counter()
+			students = run(credentials, args)
+			elapsed = time.perf_counter() - start
+			if any(student.marks is None for student in students):
+				raise Exception(f'{name} did not fetch every student!')
+
+			baseline = baseline or elapsed
+			print(f'  {elapsed:.2f} s, {args.students / elapsed:.1f} students/s ({baseline / elapsed:.1f}x faster)')
+	finally:
+		server.stop()
@@ -0,0 +1,56 @@
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from Additions.cache import PageCache
+from Additions.manager import Manager
+from Additions.sessions import SessionStore
+from Additions.student import Student
+from options import Options
+from tests.cabinet import CabinetServer
+
+DELAY = 0.1
+RUNS = 10
+
+def start(server, cache=None, sessions=None):
+	requests_number = len(server.requests)
+	begin = time.perf_counter()
+	manager = Manager(Student(login='student', password='password'), strict=False, cache=cache, sessions=sessions)
+	elapsed = time.perf_counter() - begin
+	if not manager.authorized:
+		raise Exception('The login failed!')
+	return elapsed, len(server.requests) - requests_number
+
+def measure(server, runs, cache=None, sessions=None):
+	start(server, cache, sessions)
+	results = [start(server, cache, sessions) for _ in range(runs)]
+	return statistics.median(elapsed for elapsed, _ in results), results[-1][1]
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure the start of the program with and without the saved session and page')
+	parser.add_argument('--delay', type=float, default=DELAY, help='time the cabinet takes to answer in seconds')
+	parser.add_argument('--runs', type=int, default=RUNS, help='number of measurements')
+	args = parser.parse_args()
+
+	server = CabinetServer(delay=args.delay).start()
+	Options.URL = server.url
+	print(f'{args.delay * 1000:.0f} ms per answer')
+
+	try:
+		with tempfile.TemporaryDirectory() as directory:
+			modes = [
+				('cold: login and page', {}),
+				('saved session', {'sessions':SessionStore(os.path.join(directory, 'sessions.json'))}),
+				('session and stale page', {'sessions':SessionStore(os.path.join(directory, 'stale.json')), 'cache':PageCache(os.path.join(directory, 'stale'), ttl=0)}),
+				('session and fresh page', {'sessions':SessionStore(os.path.join(directory, 'fresh.json')), 'cache':PageCache(os.path.join(directory, 'fresh'), ttl=3600)}),
+			]
+
+			cold = None
+			for name, stores in modes:
+				elapsed, requests_number = measure(server, args.runs, **stores)
+				cold = cold or elapsed
+				print(f'{name + ":":24} {elapsed * 1000:8.1f} ms, requests: {requests_number} ({cold / elapsed:.1f}x faster)')
+	finally:
+		server.stop()
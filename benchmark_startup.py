@@ -0,0 +1,44 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BUDGET_MS = 50
+RUNS = 5
+DEFERRED = ['bs4', 'requests', 'urllib3', 'wcwidth', 'textwrap', 'random', 'statistics', 'copy']
+
+def measure():
+	result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import main'], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True)
+
+	imports = {}
+	for line in result.stderr.splitlines():
+		if not line.startswith('import time:') or 'cumulative' in line:
+			continue
+		_, cumulative, name = line[len('import time:'):].split('|')
+		imports[name.strip()] = int(cumulative) / 1000
+		if name.startswith(' ') and not name.startswith('  '):
+			if name.strip() == 'main':
+				return imports
+			imports = {}
+	raise Exception('main.py was not imported!')
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure the time needed to import main.py')
+	parser.add_argument('--runs', type=int, default=RUNS, help='number of measurements')
+	parser.add_argument('--budget', type=float, default=BUDGET_MS, help='allowed import time of main.py in milliseconds')
+	args = parser.parse_args()
+
+	measure()
+	runs = [measure() for _ in range(args.runs)]
+	total = statistics.median(imports['main'] for imports in runs)
+
+	print(f'main.py: {total:.1f} ms (budget {args.budget:.0f} ms)')
+	for name, time in sorted(runs[-1].items(), key=lambda item: item[1], reverse=True)[:10]:
+		print(f'{time:8.1f} ms  {name}')
+
+	eager = [name for name in DEFERRED if name in runs[-1]]
+	if eager:
+		print(f'Imported on startup: {", ".join(eager)}')
+	if total > args.budget or eager:
+		sys.exit(1)
@@ -0,0 +1,91 @@
+import argparse
+import copy
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from Utils import renderer
+from Utils.table import Table
+from options import Options
+
+ROWS = 100000
+APPENDS = 10
+FIELDS = ['Предмет', 'Оценки', 'Кол-во оценок', 'Средний балл', 'До допуска']
+
+class LegacyTable(Table):
+	# Table as it was before the rows stopped being deep-copied on every render
+	def _get_rows(self, options):
+		return copy.deepcopy(super()._get_rows(options))
+
+def build(cls, rows):
+	rng = random.Random(0)
+	active = renderer.active
+	table = cls(FIELDS)
+	for index in range(rows):
+		values = [rng.randint(0, Options.MAX_MARK) for _ in range(rng.randint(0, 15))]
+		mean = round(sum(values) / len(values), 2) if values else 0
+		table.add_row([active.subject(f'Предмет {index}', mean), active.marks(values), active.marks_number(len(values)), active.mean(mean), active.access(len(values), 0)])
+	return table
+
+def render_legacy(rows):
+	return len(build(LegacyTable, rows).get_string())
+
+def render(rows):
+	return len(build(Table, rows).get_string())
+
+def stream(rows):
+	with open(os.devnull, 'w', encoding='utf-8') as fp:
+		build(Table, rows).write_to(fp)
+
+MODES = {
+	'deepcopy, get_string()': render_legacy,
+	'get_string()': render,
+	'write_to()': stream,
+}
+
+def measure(mode, rows):
+	# Every mode runs in its own process so that ru_maxrss is its own peak
+	result = subprocess.run([sys.executable, os.path.abspath(__file__), '--rows', str(rows), '--mode', mode], cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True, check=True)
+	elapsed, rss = result.stdout.split()
+	return float(elapsed), int(rss)
+
+def append_cycle(table, appends, incremental):
+	options = table._get_options({})
+	rows = list(table._rows[:appends])
+	start = time.perf_counter()
+	for row in rows:
+		table.add_row(row)
+		if not incremental:
+			table._data_widths = None
+		table._compute_widths(None, options)
+	return time.perf_counter() - start
+
+if __name__ == '__main__':
+	parser = argparse.ArgumentParser(description='measure the time and memory needed to render a large table')
+	parser.add_argument('--rows', type=int, default=ROWS, help='number of rows in the table')
+	parser.add_argument('--appends', type=int, default=APPENDS, help='number of rows added one by one after the table is built')
+	parser.add_argument('--mode', choices=MODES, help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	if args.mode is not None:
+		start = time.perf_counter()
+		MODES[args.mode](args.rows)
+		elapsed = time.perf_counter() - start
+		print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+		sys.exit()
+
+	print(f'{args.rows} rows')
+	for mode in MODES:
+		elapsed, rss = measure(mode, args.rows)
+		print(f'{mode + ":":24} {elapsed:6.2f} s, peak RSS {rss // 1024} MB')
+
+	table = build(Table, args.rows)
+	table.get_string()
+	full = append_cycle(table, args.appends, incremental=False)
+	incremental = append_cycle(table, args.appends, incremental=True)
+	print(f'{args.appends} rows added one by one, widths after each')
+	print(f'{"widths from all rows:":24} {full * 1000:8.1f} ms')
+	print(f'{"widths kept up to date:":24} {incremental * 1000:8.1f} ms ({full / incremental:.0f}x faster)')
@@ -1,7 +1,64 @@
+import argparse
+import sys
+
+from Additions.browser import connection_stats
+from Additions.cache import PageCache
 from Additions.manager import Manager
+from Additions.sessions import SessionStore
+from Additions.store import SnapshotStore
+from Additions.watcher import Watcher
 from Additions.student import Student
+from Utils import renderer
 from options import Options
 
 if __name__ == '__main__':
-	manager = Manager(Student(login=Options.LOGIN, password=Options.PASSWORD))
-	print(manager.view)
+	parser = argparse.ArgumentParser()
+	parser.add_argument('--no-color', action='store_true', help='print the table without ANSI colors')
+	parser.add_argument('--format', choices=['table', 'csv', 'jsonl', 'parquet'], default='table', help='output format')
+	parser.add_argument('--output', help='file to write the output to, standard output by default')
+	parser.add_argument('--watch', action='store_true', help='keep checking the grades and print the table when they change')
+	args = parser.parse_args()
+
+	if args.format == 'parquet' and not args.output:
+		parser.error('--output is required for the parquet format')
+	if args.watch and args.format != 'table':
+		parser.error('--watch works only with the table format')
+	if args.watch and args.output:
+		parser.error('--watch prints the table and cannot be used with --output')
+
+	renderer.setup(color=not args.no_color)
+
+	cache = PageCache()
+	sessions = SessionStore()
+	manager = Manager(Student(login=Options.LOGIN, password=Options.PASSWORD), cache=cache, sessions=sessions)
+
+	if args.format == 'table' and args.output:
+		with open(args.output, 'w', encoding='utf-8') as file:
+			print(manager.view, file=file)
+	elif args.format == 'table':
+		print(manager.view)
+	elif args.format == 'parquet':
+		manager.export(args.output, args.format)
+	elif args.output:
+		with open(args.output, 'w', encoding='utf-8', newline='') as file:
+			manager.export(file, args.format)
+	else:
+		manager.export(sys.stdout, args.format)
+
+	store = SnapshotStore()
+	print(f'Новых оценок: {store.save(manager.student)}', file=sys.stderr)
+	store.close()
+
+	print(cache.report(), file=sys.stderr)
+	stats = connection_stats()
+	print(f'Соединений: {stats["connections"]}, запросов: {stats["requests"]}, повторно использовано: {stats["reused"]}', file=sys.stderr)
+
+	if args.watch:
+		watcher = Watcher(manager)
+		try:
+			watcher.run(log=lambda line: print(line, file=sys.stderr))
+		except KeyboardInterrupt:
+			pass
+		print(watcher.report(), file=sys.stderr)
+		if not watcher.authorized:
+			manager.error_auth()
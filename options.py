@@ -3,4 +3,30 @@ class Options:
 	PASSWORD = 'ENTER_PASSWORD'
 
 	EXCELLENT_MARK = 8
+	ASSUMED_MARK = 9
 	MAX_MARK = 10
+
+	URL = 'http://best.yos.kz/cabinet/'
+	WORKERS = 8
+	QUEUE_SIZE = 16
+
+	TIMEOUT = 10
+	RETRIES = 3
+	BACKOFF = 0.5
+	POOL_CONNECTIONS = 4
+	POOL_SIZE = 16
+
+	RATE = 10
+	BURST = 10
+	TARGET_LATENCY = 2
+
+	WATCH_INTERVAL = 300
+	WATCH_JITTER = 0.2
+
+	CACHE_DIR = '.cache'
+	CACHE_TTL = 300
+	CACHE_MAX_SIZE = 50 * 1024 * 1024
+	CACHE_MAX_AGE = 7 * 24 * 60 * 60
+
+	SESSION_FILE = '.sessions.json'
+	STORE_PATH = '.grades.db'
@@ -0,0 +1,107 @@
+import contextlib
+import hashlib
+import os
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+def read(name):
+	with open(os.path.join(FIXTURES, name), encoding='utf-8') as file:
+		return file.read()
+
+class CabinetHandler(BaseHTTPRequestHandler):
+	protocol_version = 'HTTP/1.1'
+
+	def log_message(self, *args):
+		pass
+
+	def send(self, status, body='', headers=()):
+		content = body.encode()
+		self.send_response(status)
+		self.send_header('Content-Type', 'text/html; charset=utf-8')
+		self.send_header('Content-Length', str(len(content)))
+		for name, value in headers:
+			self.send_header(name, value)
+		self.end_headers()
+		self.wfile.write(content)
+
+	def do_POST(self):
+		with self.server.busy():
+			self.server.requests.append(('POST', self.path))
+			length = int(self.headers.get('Content-Length', 0))
+			form = urllib.parse.parse_qs(self.rfile.read(length).decode())
+			login = form.get('login', [''])[0]
+
+			if form.get('password', [''])[0] != self.server.passwords.get(login, 'password'):
+				self.send(200, read('login_error.html'))
+			else:
+				token = f'{login}-{len(self.server.requests)}'
+				self.server.sessions[token] = login
+				self.send(200, '<html></html>', [('Set-Cookie', f'sid={token}; Path=/')])
+
+	def do_GET(self):
+		with self.server.busy():
+			self.server.requests.append(('GET', self.path))
+			cookie = self.headers.get('Cookie', '')
+			token = cookie.split('sid=')[1].split(';')[0] if 'sid=' in cookie else None
+			login = self.server.sessions.get(token)
+			if login is None:
+				self.send(200, read('login.html'))
+				return
+
+			html = self.server.pages.get(login, read('grades.html')).replace('Иванов Иван', login)
+			etag = f'"{hashlib.sha256(html.encode()).hexdigest()[:16]}"'
+			if self.headers.get('If-None-Match') == etag:
+				self.server.not_modified += 1
+				self.send(304, headers=[('ETag', etag)])
+				return
+			self.send(200, html, [('ETag', etag)])
+
+class CabinetServer(ThreadingHTTPServer):
+	# A local copy of the cabinet: every answer waits delay seconds plus
+	# congestion seconds for every other request being served at the time
+	daemon_threads = True
+
+	def __init__(self, delay=0, congestion=0):
+		super().__init__(('127.0.0.1', 0), CabinetHandler)
+		self.delay = delay
+		self.congestion = congestion
+
+		self.requests = []
+		self.passwords = {}
+		self.pages = {}
+		self.sessions = {}
+		self.not_modified = 0
+		self.active = 0
+
+		self._lock = threading.Lock()
+		self._thread = None
+
+	@property
+	def url(self):
+		return f'http://127.0.0.1:{self.server_address[1]}/cabinet/'
+
+	@contextlib.contextmanager
+	def busy(self):
+		with self._lock:
+			self.active += 1
+			wait = self.delay + self.congestion * (self.active - 1)
+		try:
+			if wait:
+				time.sleep(wait)
+			yield
+		finally:
+			with self._lock:
+				self.active -= 1
+
+	def start(self):
+		self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+		self._thread.start()
+		return self
+
+	def stop(self):
+		self.shutdown()
+		self.server_close()
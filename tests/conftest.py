@@ -0,0 +1,11 @@
+import pytest
+
+from options import Options
+from tests.cabinet import CabinetServer
+
+@pytest.fixture
+def server(monkeypatch):
+	httpd = CabinetServer().start()
+	monkeypatch.setattr(Options, 'URL', httpd.url)
+	yield httpd
+	httpd.stop()
@@ -0,0 +1,31 @@
+import asyncio
+
+import pytest
+
+from Additions.student import Student
+
+aiohttp = pytest.importorskip('aiohttp')
+
+from Additions.async_browser import AsyncBrowser, create_connector
+
+async def fetch(connector, student):
+	async with AsyncBrowser(connector) as browser:
+		if not await browser.login(student):
+			return None
+		await browser.setup_page_content()
+		return await browser.get_student_name(), [list(mark.values) for mark in await browser.get_student_marks()]
+
+async def fetch_all(students):
+	connector = create_connector(limit_per_host=4)
+	try:
+		return await asyncio.gather(*(fetch(connector, student) for student in students))
+	finally:
+		await connector.close()
+
+def test_async_browser(server):
+	server.passwords['student2'] = 'secret'
+	results = asyncio.run(fetch_all([Student(f'student{index}', 'password') for index in range(8)]))
+
+	assert results[2] is None
+	assert [result[0] for result in results if result is not None] == [f'student{index}' for index in range(8) if index != 2]
+	assert results[0][1] == [[8, 10, 7, 9], [6, 7, 5], [10, 10, 9], [4, 8, 8, 9, 7, 6], []]
@@ -0,0 +1,68 @@
+import bs4
+import pytest
+
+from Additions.browser import get_adapter, get_parser, is_authorized, parse_page, parse_student_marks, parse_student_name
+from tests.cabinet import read
+
+GRADES = ['grades.html', 'grades_large.html']
+PARSERS = ['html.parser', pytest.param('lxml', marks=pytest.mark.skipif(not bs4.builder_registry.lookup('lxml'), reason='lxml is not installed'))]
+
+def legacy_parse(html):
+	page_content = bs4.BeautifulSoup(html, 'html.parser')
+	rows = page_content.find_all("tr", {"class":"cl-row"})
+
+	subjects_number = 0
+	while True:
+		try:
+			float(rows[subjects_number].find_all('td')[0].getText())
+			subjects_number += 1
+		except ValueError:
+			break
+
+	marks = []
+	for i, tr in enumerate(rows[subjects_number:subjects_number * 2]):
+		values = []
+		for td in tr.find_all('td'):
+			if td.find('span') is not None and len(td.find('span')) != 0:
+				values.append(int(td.find('span').getText()))
+		marks.append((rows[i].find_all('td')[1].getText(), values))
+
+	return page_content.find_all("div", {"class":"top-panel-name"})[0].getText(), marks
+
+def parse(html, parser=None):
+	page_content = parse_page(html, parser)
+	return parse_student_name(page_content), [(mark.subject, list(mark.values)) for mark in parse_student_marks(page_content)]
+
+@pytest.mark.parametrize('name', GRADES)
+def test_parse_matches_legacy(name):
+	html = read(name)
+	assert parse(html) == legacy_parse(html)
+
+def test_parse_grades():
+	assert parse(read('grades.html')) == ('Иванов Иван', [
+		('Алгебра', [8, 10, 7, 9]),
+		('Геометрия', [6, 7, 5]),
+		('Русский язык', [10, 10, 9]),
+		('Физика', [4, 8, 8, 9, 7, 6]),
+		('Физическая культура', []),
+	])
+
+@pytest.mark.parametrize('parser', PARSERS)
+@pytest.mark.parametrize('name', GRADES)
+def test_parsers_agree(name, parser):
+	html = read(name)
+	assert parse(html, parser) == legacy_parse(html)
+
+@pytest.mark.parametrize('parser', PARSERS)
+def test_is_authorized(parser):
+	assert is_authorized(read('grades.html'), parser)
+	assert is_authorized(read('login.html'), parser)
+	assert not is_authorized(read('login_error.html'), parser)
+
+def test_default_parser():
+	assert get_parser() == ('lxml' if bs4.builder_registry.lookup('lxml') else 'html.parser')
+
+def test_login_is_not_retried():
+	retry = get_adapter().max_retries
+	assert retry.is_retry('GET', 503)
+	assert not retry.is_retry('POST', 503)
@@ -0,0 +1,45 @@
+from Additions.cache import PageCache
+from Additions.manager import Manager
+from Additions.sessions import SessionStore
+from Additions.student import Student
+
+def run(cache, sessions):
+	manager = Manager(Student('student', 'password'), strict=False, cache=cache, sessions=sessions)
+	assert manager.authorized
+	return manager
+
+def test_warm_runs_use_the_cache(server, tmp_path):
+	sessions = SessionStore(str(tmp_path / 'sessions.json'))
+	cache = PageCache(str(tmp_path / 'cache'), ttl=300)
+
+	first = run(cache, sessions)
+	assert server.requests == [('POST', '/cabinet/'), ('GET', '/cabinet/?module=grades')]
+
+	second = run(cache, sessions)
+	assert len(server.requests) == 2
+	assert (cache.hits, cache.misses) == (1, 1)
+	assert [list(mark.values) for mark in second.student.marks] == [list(mark.values) for mark in first.student.marks]
+
+def test_stale_cache_is_revalidated(server, tmp_path):
+	sessions = SessionStore(str(tmp_path / 'sessions.json'))
+	cache = PageCache(str(tmp_path / 'cache'), ttl=0)
+
+	run(cache, sessions)
+	for _ in range(2):
+		manager = run(cache, sessions)
+
+	assert server.requests.count(('POST', '/cabinet/')) == 1
+	assert server.not_modified == 2
+	assert (cache.hits, cache.misses, cache.revalidations) == (0, 1, 2)
+	assert manager.student.name == 'student'
+
+def test_expired_session_logs_in_again(server, tmp_path):
+	sessions = SessionStore(str(tmp_path / 'sessions.json'))
+	cache = PageCache(str(tmp_path / 'cache'), ttl=0)
+
+	run(cache, sessions)
+	server.sessions.clear()
+	manager = Manager(Student('student', 'password'), strict=False, cache=cache, sessions=sessions)
+
+	assert server.requests.count(('POST', '/cabinet/')) == 2
+	assert manager.authorized
@@ -0,0 +1,53 @@
+from Additions.limiter import RateLimiter
+from Additions.roster import fetch_roster
+
+def limiter():
+	return RateLimiter(rate=1000, burst=100, max_concurrency=16, target_latency=1)
+
+def test_one_decrease_per_window():
+	rate_limiter = limiter()
+	for _ in range(8):
+		rate_limiter.acquire()
+	for _ in range(8):
+		rate_limiter.release(latency=5)
+
+	assert rate_limiter.metrics()['limit'] == 8
+	assert rate_limiter.metrics()['decreases'] == 1
+
+def test_new_window_can_decrease_again():
+	rate_limiter = limiter()
+	for _ in range(2):
+		for _ in range(4):
+			rate_limiter.acquire()
+		for _ in range(4):
+			rate_limiter.release(latency=0, error=True)
+
+	assert rate_limiter.metrics()['limit'] == 4
+	assert rate_limiter.metrics()['decreases'] == 2
+
+def test_additive_increase():
+	rate_limiter = limiter()
+	rate_limiter.acquire()
+	rate_limiter.release(latency=5)
+	assert rate_limiter.limit == 8
+
+	for _ in range(8):
+		rate_limiter.acquire()
+		rate_limiter.release(latency=0)
+	assert 8.9 < rate_limiter.limit < 9
+
+def test_limit_follows_the_cabinet(server):
+	rate_limiter = limiter()
+	rate_limiter.target_latency = 0.1
+	credentials = [(f'student{index}', 'password') for index in range(40)]
+
+	server.delay = 0.2
+	fetch_roster(credentials[:8], workers=16, limiter=rate_limiter)
+	dropped = rate_limiter.metrics()
+	assert dropped['limit'] < 16
+	assert dropped['decreases'] >= 1
+
+	server.delay = 0
+	managers = fetch_roster(credentials, workers=16, limiter=rate_limiter)
+	assert all(manager.authorized for manager in managers)
+	assert rate_limiter.metrics()['limit'] >= 2 * dropped['limit']
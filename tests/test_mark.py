@@ -0,0 +1,58 @@
+import random
+import statistics
+
+import pytest
+
+from Additions.mark import Mark
+from Additions.student import Student
+from Utils import renderer
+
+def build(values):
+	mark = Mark('Математика')
+	for value in values:
+		mark.add_mark(value)
+	return mark
+
+@pytest.mark.parametrize('seed', range(10))
+def test_running_statistics(seed):
+	rng = random.Random(seed)
+	values = [rng.randint(0, 10) for _ in range(rng.randint(2, 500))]
+	mark = build(values)
+
+	assert mark.marks_number == len(values)
+	assert mark.total == sum(values)
+	assert mark.min == min(values)
+	assert mark.max == max(values)
+	assert mark.mean == round(statistics.mean(values), 2)
+	assert mark.variance == pytest.approx(statistics.variance(values))
+	assert mark.stdev == pytest.approx(statistics.stdev(values))
+
+def test_empty_mark():
+	mark = Mark('Математика')
+	assert mark.marks_number == 0
+	assert mark.mean == 0
+	assert mark.variance == 0
+	assert mark.min is None and mark.max is None
+
+def test_add_mark_accepts_text():
+	mark = build(['8', '10'])
+	assert list(mark.values) == [8, 10]
+	assert mark.mean == 9
+
+def test_compact_storage():
+	mark = build([8, 9, 10])
+	assert mark.values.typecode == 'b'
+	assert mark.values.itemsize == 1
+	assert not hasattr(mark, '__dict__')
+	assert not hasattr(Student('login', 'password'), '__dict__')
+
+def test_views_are_rendered_on_demand():
+	mark = build([10, 7])
+	assert mark.view_marks == renderer.active.marks(mark.values)
+	assert mark.view_mean == renderer.active.mean(8.5)
+	assert mark.view_access == renderer.active.access(2, 0)
+
+def test_access_grid():
+	mark = build([5, 8, 10])
+	assert mark.access_grid([(7, 9), (8, 9), (9, 10), (9, 9), (10, 10)]) == [0, 1, 4, None, None]
+	assert Mark('Математика').access_grid([(9, 9)]) == [0]
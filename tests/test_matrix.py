@@ -0,0 +1,75 @@
+import random
+import statistics
+
+import pytest
+
+from Additions.mark import Mark
+from Additions.report import StudentReport
+from Additions.student import Student
+from Utils.umath import access
+from options import Options
+
+numpy = pytest.importorskip('numpy')
+
+from Additions.matrix import GradeMatrix
+
+SUBJECTS = ['Алгебра', 'Геометрия', 'Физика', 'Химия', 'История']
+
+def roster(seed, size=200):
+	rng = random.Random(seed)
+	students = []
+	for index in range(size):
+		student = Student(f'student{index}', 'password')
+		if rng.random() < 0.05:
+			students.append(student)
+			continue
+
+		student.marks = []
+		for subject in rng.sample(SUBJECTS, rng.randint(0, len(SUBJECTS))):
+			mark = Mark(subject)
+			for _ in range(rng.choice([0, rng.randint(1, 30)])):
+				mark.add_mark(rng.randint(0, Options.MAX_MARK))
+			student.marks.append(mark)
+		students.append(student)
+	return students
+
+def marks(students):
+	return [mark for student in students for mark in student.marks or []]
+
+@pytest.mark.parametrize('seed', range(5))
+def test_means_match_mark(seed):
+	students = roster(seed)
+	assert GradeMatrix(students).means().tolist() == [mark.mean for mark in marks(students)]
+
+@pytest.mark.parametrize('seed', range(5))
+def test_access_matches_umath(seed):
+	students = roster(seed)
+	matrix = GradeMatrix(students)
+
+	assert matrix.access().tolist() == [mark.access for mark in marks(students)]
+	for target, filler in [(7, 9), (9, 10), (6, 7), (8, 8)]:
+		expected = [0 if mark.count == 0 or mark.mean >= target else access(mark.total, mark.count, target, filler) for mark in marks(students)]
+		assert matrix.access(target, filler).tolist() == expected
+
+def test_unreachable_access():
+	students = roster(0)
+	result = GradeMatrix(students).access(10, 10)
+	assert result.tolist() == [mark.access_grid([(10, 10)])[0] for mark in marks(students)]
+	assert result.mask.tolist() == [bool(mark.count) and mark.mean < 10 for mark in marks(students)]
+
+@pytest.mark.parametrize('seed', range(5))
+def test_student_means_match_report(seed):
+	students = roster(seed)
+	assert GradeMatrix(students).student_means().tolist() == [StudentReport(student).mean if student.marks else 0 for student in students]
+
+@pytest.mark.parametrize('seed', range(5))
+def test_subject_means(seed):
+	students = roster(seed)
+	means = {}
+	for mark in marks(students):
+		if mark.mean != 0:
+			means.setdefault(mark.subject, []).append(mark.mean)
+
+	result = GradeMatrix(students).subject_means()
+	for subject in result:
+		assert result[subject] == (round(statistics.mean(means[subject]), 2) if subject in means else 0)
@@ -0,0 +1,37 @@
+import pytest
+
+from Additions.roster import Pipeline, fetch_roster
+
+CREDENTIALS = [(f'student{index}', 'password') for index in range(12)]
+
+def test_fetch_roster_keeps_order(server):
+	server.passwords['student3'] = 'secret'
+	managers = fetch_roster(CREDENTIALS, workers=4)
+
+	assert [manager.student.login for manager in managers] == [login for login, password in CREDENTIALS]
+	assert [manager.authorized for manager in managers] == [login != 'student3' for login, password in CREDENTIALS]
+	assert managers[0].student.name == 'student0'
+	assert [list(mark.values) for mark in managers[0].student.marks][0] == [8, 10, 7, 9]
+
+def test_unauthorized_manager_has_no_report(server):
+	server.passwords['student0'] = 'secret'
+	manager, = fetch_roster(CREDENTIALS[:1])
+
+	assert manager.student.marks is None
+	with pytest.raises(Exception, match='вход не выполнен'):
+		manager.analyze()
+	with pytest.raises(Exception, match='вход не выполнен'):
+		manager.view
+	with pytest.raises(Exception, match='вход не выполнен'):
+		manager.access_matrix([(8, 9)])
+
+def test_pipeline_keeps_order(server):
+	server.passwords['student5'] = 'secret'
+	pipeline = Pipeline(fetch_workers=4, parse_workers=2, queue_size=2)
+	students = pipeline.run(CREDENTIALS)
+
+	assert [student.login for student in students] == [login for login, password in CREDENTIALS]
+	assert [student.name for student in students] == [login if login != 'student5' else '' for login, password in CREDENTIALS]
+	assert students[5].marks is None
+	assert len(students[0].marks) == 5
+	assert pipeline.timings['parse'] > 0
@@ -0,0 +1,26 @@
+import os
+import stat
+
+from Additions.sessions import SessionStore
+
+def test_sessions_round_trip(tmp_path):
+	path = str(tmp_path / 'sessions.json')
+	SessionStore(path).save('student', {'sid':'token'})
+
+	store = SessionStore(path)
+	assert store.load('student') == {'sid':'token'}
+	assert store.load('other') is None
+
+	store.drop('student')
+	assert SessionStore(path).load('student') is None
+
+def test_sessions_file_is_private(tmp_path):
+	path = str(tmp_path / 'sessions.json')
+	previous = os.umask(0)
+	try:
+		SessionStore(path).save('student', {'sid':'token'})
+	finally:
+		os.umask(previous)
+
+	assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+	assert os.listdir(tmp_path) == ['sessions.json']
@@ -0,0 +1,60 @@
+import time
+
+from Additions.mark import Mark
+from Additions.store import SnapshotStore
+from Additions.student import Student
+
+def student(login, subjects):
+	result = Student(login, 'password')
+	result.marks = []
+	for subject, values in subjects.items():
+		mark = Mark(subject)
+		for value in values:
+			mark.add_mark(value)
+		result.marks.append(mark)
+	return result
+
+def test_only_new_marks_are_added(tmp_path):
+	store = SnapshotStore(str(tmp_path / 'grades.db'))
+	assert store.save_roster([student('first', {'Алгебра':[8, 9], 'Физика':[7]}), student('second', {'Алгебра':[10]})]) == 4
+
+	since = time.time()
+	assert store.save_roster([student('first', {'Алгебра':[8, 9, 10], 'Физика':[7]}), student('second', {'Алгебра':[5, 10]})]) == 3
+
+	assert [row[:4] for row in store.added_since(since)] == [('first', 'Алгебра', 2, 10), ('second', 'Алгебра', 0, 5), ('second', 'Алгебра', 1, 10)]
+	assert store.history('first') == {'Алгебра':[8, 9, 10], 'Физика':[7]}
+	assert store.history('second') == {'Алгебра':[5, 10]}
+
+def test_failed_logins_are_skipped(tmp_path):
+	store = SnapshotStore(str(tmp_path / 'grades.db'))
+	assert store.save_roster([student('first', {'Алгебра':[8]}), Student('failed', 'password')]) == 1
+	assert store.history('first') == {'Алгебра':[8]}
+	assert store.history('failed') == {}
+
+def test_added_since_for_some_logins(tmp_path, monkeypatch):
+	monkeypatch.setattr('Additions.store.BATCH_SIZE', 2)
+	store = SnapshotStore(str(tmp_path / 'grades.db'))
+	since = time.time()
+	store.save_roster([student(f'student{index}', {'Алгебра':[index % 10]}) for index in range(6)])
+
+	rows = store.added_since(since, logins=['student4', 'student1', 'student5'])
+	assert [row[:4] for row in rows] == [('student1', 'Алгебра', 0, 1), ('student4', 'Алгебра', 0, 4), ('student5', 'Алгебра', 0, 5)]
+	assert store.added_since(since, logins=[]) == []
+	assert len(store.added_since(since)) == 6
+
+def test_login_query_uses_index(tmp_path):
+	store = SnapshotStore(str(tmp_path / 'grades.db'))
+	plan = store._connection.execute('EXPLAIN QUERY PLAN SELECT * FROM grades WHERE scraped_at >= 0 AND login IN (?, ?)', ('first', 'second')).fetchall()
+	assert 'grades_login_scraped_at' in str(plan)
+
+def test_regraded_marks(tmp_path):
+	store = SnapshotStore(str(tmp_path / 'grades.db'))
+	store.save(student('first', {'Алгебра':[5, 6, 7, 8, 9, 10, 9, 8, 7, 6]}))
+
+	since = time.time()
+	assert store.save(student('first', {'Алгебра':[8, 6, 7, 8, 9, 10, 9, 8, 7, 6, 10]})) == 2
+	assert [row[:4] for row in store.added_since(since)] == [('first', 'Алгебра', 0, 8), ('first', 'Алгебра', 10, 10)]
+	assert store.history('first') == {'Алгебра':[8, 6, 7, 8, 9, 10, 9, 8, 7, 6, 10]}
+
+	assert store.save(student('first', {'Алгебра':[8, 6, 7]})) == 0
+	assert store.history('first') == {'Алгебра':[8, 6, 7]}
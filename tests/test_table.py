@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from Utils.table import Table
+
+def build(rows):
+	table = Table(['student', 'mean', 'access'])
+	for row in rows:
+		table.add_row(row)
+	return table
+
+@pytest.fixture
+def rows():
+	rng = random.Random(0)
+	return [[f'student{index}', rng.randint(0, 10), rng.randint(0, 5)] for index in range(200)]
+
+@pytest.mark.parametrize('reversesort', [False, True])
+@pytest.mark.parametrize('end', [None, 10])
+def test_sorted_rows(rows, reversesort, end):
+	table = build(rows)
+	expected = sorted(rows, key=lambda row: [row[1], row[2]] + row, reverse=reversesort)[:end]
+	options = {'sortby':['mean', 'access'], 'reversesort':reversesort}
+	if end is not None:
+		options['end'] = end
+
+	for _ in range(2):
+		assert table._get_rows(table._get_options(options)) == expected
+
+def test_sort_cache_is_bounded(rows):
+	table = build(rows)
+	for _ in range(50):
+		table.get_string(sortby='mean', sort_key=lambda values: values)
+		table.get_string(sortby='access', sort_key=lambda values: values)
+
+	assert len(table._sort_cache) == 2
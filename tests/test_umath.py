@@ -0,0 +1,64 @@
+import random
+import statistics
+
+import pytest
+
+from Additions.mark import Mark
+from Utils.umath import access, assumed_mark
+from options import Options
+
+def legacy_access(values, target=8, filler=9):
+	values = list(values)
+	mean = statistics.mean(values)
+	access_value = 0
+
+	while mean < target:
+		values.append(filler)
+		mean = statistics.mean(values)
+		access_value += 1
+
+	return access_value
+
+def random_marks(rng):
+	return [rng.randint(0, Options.MAX_MARK) for _ in range(rng.randint(1, 15))]
+
+@pytest.mark.parametrize('seed', range(20))
+def test_access_matches_legacy_loop(seed):
+	rng = random.Random(seed)
+	for _ in range(50):
+		values = random_marks(rng)
+		target = rng.randint(1, Options.MAX_MARK)
+		filler = rng.randint(target + 1, Options.MAX_MARK + 1)
+		assert access(sum(values), len(values), target, filler) == legacy_access(values, target, filler)
+
+def test_access_default_matches_legacy_loop():
+	rng = random.Random(0)
+	for _ in range(1000):
+		values = random_marks(rng)
+		assert access(sum(values), len(values)) == legacy_access(values)
+
+def test_access_unreachable():
+	assert access(5, 1, 9, 9) is None
+	assert access(5, 1, 10, 10) is None
+	assert access(9, 1, 9, 9) == 0
+	assert access(0, 0, 9, 9) == 0
+
+@pytest.mark.parametrize('excellent', [7, 8, 9, 10])
+def test_mark_access(monkeypatch, excellent):
+	monkeypatch.setattr(Options, 'EXCELLENT_MARK', excellent)
+	rng = random.Random(excellent)
+	for _ in range(200):
+		values = random_marks(rng)
+		mark = Mark('Математика')
+		for value in values:
+			mark.add_mark(value)
+
+		if round(statistics.mean(values), 2) >= excellent:
+			assert mark.access == 0
+		elif excellent == Options.MAX_MARK:
+			assert mark.access is None
+		else:
+			assert mark.access == legacy_access(values, excellent, assumed_mark(excellent))
+
+def test_empty_mark_access():
+	assert Mark('Математика').access == 0
@@ -0,0 +1,39 @@
+from Additions.manager import Manager
+from Additions.report import StudentReport, render
+from Additions.sessions import SessionStore
+from Additions.student import Student
+from Additions.watcher import Watcher
+from tests.cabinet import read
+
+def test_watcher(server, tmp_path):
+	manager = Manager(Student('student', 'password'), strict=False, sessions=SessionStore(str(tmp_path / 'sessions.json')))
+	watcher = Watcher(manager, interval=0, jitter=0)
+
+	assert watcher.poll() is None
+	assert watcher.poll() is None
+	assert (watcher.polls, watcher.short_circuits, watcher.rerendered) == (2, 1, 0)
+
+	server.pages['student'] = read('grades.html').replace('<span>4</span>', '<span>9</span>')
+	view = watcher.poll()
+	assert view == render(StudentReport(manager.student))
+	assert manager.view == view
+	assert watcher.rerendered == 1
+
+	server.sessions.clear()
+	assert watcher.poll() is None
+	assert watcher.authorized
+	assert watcher.browser.response is None
+	assert server.requests.count(('POST', '/cabinet/')) == 2
+	assert watcher.poll() is None
+
+def test_watcher_stops_when_login_fails(server, tmp_path):
+	manager = Manager(Student('student', 'password'), strict=False, sessions=SessionStore(str(tmp_path / 'sessions.json')))
+	watcher = Watcher(manager, interval=0, jitter=0)
+
+	server.sessions.clear()
+	server.passwords['student'] = 'changed'
+	output = []
+	watcher.run(output.append, output.append)
+
+	assert not watcher.authorized
+	assert output == []